@@ -0,0 +1,31 @@
+"""
+Make the assets hash unique index partial
+Revision ID: 0002_partial_assets_hash_index
+Revises: 0001_assets
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_partial_assets_hash_index"
+down_revision = "0001_assets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Seed assets have hash=NULL until they are hashed; keep them out of the unique index
+    op.drop_index("uq_assets_hash", table_name="assets")
+    op.create_index(
+        "uq_assets_hash",
+        "assets",
+        ["hash"],
+        unique=True,
+        sqlite_where=sa.text("hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_assets_hash", table_name="assets")
+    op.create_index("uq_assets_hash", "assets", ["hash"], unique=True)
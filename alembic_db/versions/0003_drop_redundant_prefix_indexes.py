@@ -0,0 +1,31 @@
+"""
+Drop single-column indexes that are prefixes of composite indexes
+Revision ID: 0003_drop_redundant_prefix_indexes
+Revises: 0002_partial_assets_hash_index
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+
+revision = "0003_drop_redundant_prefix_indexes"
+down_revision = "0002_partial_assets_hash_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # covered by ix_assets_info_owner_name (owner_id, name)
+    op.drop_index("ix_assets_info_owner_id", table_name="assets_info")
+    # covered by uq_assets_info_asset_owner_name (asset_id, owner_id, name)
+    op.drop_index("ix_assets_info_asset_id", table_name="assets_info")
+    # covered by pk_asset_info_tags (asset_info_id, tag_name)
+    op.drop_index("ix_asset_info_tags_asset_info_id", table_name="asset_info_tags")
+    # duplicate of uq_asset_cache_state_file_path
+    op.drop_index("ix_asset_cache_state_file_path", table_name="asset_cache_state")
+
+
+def downgrade() -> None:
+    op.create_index("ix_asset_cache_state_file_path", "asset_cache_state", ["file_path"])
+    op.create_index("ix_asset_info_tags_asset_info_id", "asset_info_tags", ["asset_info_id"])
+    op.create_index("ix_assets_info_asset_id", "assets_info", ["asset_id"])
+    op.create_index("ix_assets_info_owner_id", "assets_info", ["owner_id"])
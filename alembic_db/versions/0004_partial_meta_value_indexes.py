@@ -0,0 +1,31 @@
+"""
+Make the (key, val_*) indexes on asset_info_meta partial over non-NULL values
+Revision ID: 0004_partial_meta_value_indexes
+Revises: 0003_drop_redundant_prefix_indexes
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_partial_meta_value_indexes"
+down_revision = "0003_drop_redundant_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+_VALUE_COLUMNS = ("val_str", "val_num", "val_bool")
+
+
+def upgrade() -> None:
+    # Only one val_* column is populated per row; index each one only where it is set.
+    for col in _VALUE_COLUMNS:
+        name = f"ix_asset_info_meta_key_{col}"
+        op.drop_index(name, table_name="asset_info_meta")
+        op.create_index(name, "asset_info_meta", ["key", col], sqlite_where=sa.text(f"{col} IS NOT NULL"))
+
+
+def downgrade() -> None:
+    for col in _VALUE_COLUMNS:
+        name = f"ix_asset_info_meta_key_{col}"
+        op.drop_index(name, table_name="asset_info_meta")
+        op.create_index(name, "asset_info_meta", ["key", col])
@@ -0,0 +1,31 @@
+"""
+Index assets_info listings by (owner_id, sort column, id)
+Revision ID: 0005_owner_sort_composite_indexes
+Revises: 0004_partial_meta_value_indexes
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+
+revision = "0005_owner_sort_composite_indexes"
+down_revision = "0004_partial_meta_value_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Listings filter on owner_id and order by (sort column, id); these serve both without a temp sort.
+    op.create_index("ix_assets_info_owner_created_at", "assets_info", ["owner_id", "created_at", "id"])
+    op.create_index("ix_assets_info_owner_updated_at", "assets_info", ["owner_id", "updated_at", "id"])
+    op.create_index("ix_assets_info_owner_last_access_time", "assets_info", ["owner_id", "last_access_time", "id"])
+    # superseded by the composites above
+    op.drop_index("ix_assets_info_created_at", table_name="assets_info")
+    op.drop_index("ix_assets_info_last_access_time", table_name="assets_info")
+
+
+def downgrade() -> None:
+    op.create_index("ix_assets_info_last_access_time", "assets_info", ["last_access_time"])
+    op.create_index("ix_assets_info_created_at", "assets_info", ["created_at"])
+    op.drop_index("ix_assets_info_owner_last_access_time", table_name="assets_info")
+    op.drop_index("ix_assets_info_owner_updated_at", table_name="assets_info")
+    op.drop_index("ix_assets_info_owner_created_at", table_name="assets_info")
@@ -0,0 +1,23 @@
+"""
+Drop the key-only index on asset_info_meta
+Revision ID: 0006_drop_meta_key_index
+Revises: 0005_owner_sort_composite_indexes
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+
+revision = "0006_drop_meta_key_index"
+down_revision = "0005_owner_sort_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Typed value filters use the (key, val_*) partial indexes and per-info lookups use the
+    # (asset_info_id, key, ordinal) primary key; nothing probes by key alone.
+    op.drop_index("ix_asset_info_meta_key", table_name="asset_info_meta")
+
+
+def downgrade() -> None:
+    op.create_index("ix_asset_info_meta_key", "asset_info_meta", ["key"])
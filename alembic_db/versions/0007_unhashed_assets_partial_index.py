@@ -0,0 +1,29 @@
+"""
+Add a partial index over seed (unhashed) assets
+Revision ID: 0007_unhashed_assets_partial_index
+Revises: 0006_drop_meta_key_index
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_unhashed_assets_partial_index"
+down_revision = "0006_drop_meta_key_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The scanner's orphan sweep only looks at hash IS NULL assets; index just those ids so it
+    # walks the seed assets instead of scanning the whole table.
+    op.create_index(
+        "ix_assets_unhashed",
+        "assets",
+        ["id"],
+        sqlite_where=sa.text("hash IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assets_unhashed", table_name="assets")
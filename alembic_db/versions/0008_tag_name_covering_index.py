@@ -0,0 +1,25 @@
+"""
+Make the asset_info_tags tag_name index covering
+Revision ID: 0008_tag_name_covering_index
+Revises: 0007_unhashed_assets_partial_index
+Create Date: 2026-10-16 00:00:00
+"""
+
+from alembic import op
+
+revision = "0008_tag_name_covering_index"
+down_revision = "0007_unhashed_assets_partial_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tag filters and per-tag usage counts read (tag_name, asset_info_id) pairs; carrying
+    # asset_info_id in the index answers them without touching the table.
+    op.drop_index("ix_asset_info_tags_tag_name", table_name="asset_info_tags")
+    op.create_index("ix_asset_info_tags_tag_name_info", "asset_info_tags", ["tag_name", "asset_info_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_asset_info_tags_tag_name_info", table_name="asset_info_tags")
+    op.create_index("ix_asset_info_tags_tag_name", "asset_info_tags", ["tag_name"])
@@ -1,16 +1,20 @@
+import asyncio
+import hashlib
 import logging
 import uuid
 import urllib.parse
 import os
+import time
 import contextlib
+from collections import OrderedDict
 from aiohttp import web
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 import app.assets.manager as manager
 from app import user_manager
 from app.assets.api import schemas_in
-from app.assets.helpers import get_query_dict
+from app.assets.helpers import ALLOWED_ROOTS, get_query_dict, is_lower_hex
 from app.assets.scanner import seed_assets
 
 import folder_paths
@@ -20,6 +24,21 @@ USER_MANAGER: user_manager.UserManager | None = None
 
 # UUID regex (canonical hyphenated form, case-insensitive)
 UUID_RE = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+_ASSET_PATH = f"/api/assets/{{id:{UUID_RE}}}"
+
+_DISPOSITIONS = frozenset({"inline", "attachment"})
+_FALSEY = frozenset({"0", "false", "no"})
+# strip CR/LF and swap double quotes so the filename can't break out of the quoted header value
+_CD_FILENAME_SANITIZE = str.maketrans({"\r": "", "\n": "", '"': "'"})
+
+# Clients may keep a copy but must revalidate it (ETag / Last-Modified) before reuse
+_REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+# HEAD /api/assets/hash/{hash} is probed in bursts by clients deciding what to upload;
+# remember recent answers briefly instead of hitting the database for each probe.
+_HASH_EXISTS_TTL_S = 60.0
+_HASH_EXISTS_MAX = 10_000
+_hash_exists_cache: OrderedDict[str, tuple[bool, float]] = OrderedDict()
 
 # Note to any custom node developers reading this code:
 # The assets system is not yet fully implemented, do not rely on the code in /app/assets remaining the same.
@@ -29,12 +48,54 @@ def register_assets_system(app: web.Application, user_manager_instance: user_man
     USER_MANAGER = user_manager_instance
     app.add_routes(ROUTES)
 
+def _match_uuid(request: web.Request) -> str:
+    """Canonical form of the route's {id}; UUID_RE already guarantees the hyphenated hex shape."""
+    return request.match_info["id"].lower()
+
+
 def _error_response(status: int, code: str, message: str, details: dict | None = None) -> web.Response:
     return web.json_response({"error": {"code": code, "message": message, "details": details or {}}}, status=status)
 
 
+def _model_response(model: BaseModel, status: int = 200, **dump_kwargs) -> web.Response:
+    # pydantic serializes straight to JSON text, skipping the dict + json.dumps round trip
+    return web.Response(text=model.model_dump_json(**dump_kwargs), status=status, content_type="application/json")
+
+
+def _if_none_match(request: web.Request, etag: str) -> bool:
+    etags = request.if_none_match
+    return bool(etags) and any(e.value in (etag, "*") for e in etags)
+
+
+def _cached_asset_exists(asset_hash: str) -> bool:
+    now = time.monotonic()
+    hit = _hash_exists_cache.get(asset_hash)
+    if hit is not None and hit[1] > now:
+        _hash_exists_cache.move_to_end(asset_hash)
+        return hit[0]
+    exists = manager.asset_exists(asset_hash=asset_hash)
+    _remember_asset_hash(asset_hash, exists)
+    return exists
+
+
+def _remember_asset_hash(asset_hash: str, exists: bool) -> None:
+    _hash_exists_cache[asset_hash] = (exists, time.monotonic() + _HASH_EXISTS_TTL_S)
+    _hash_exists_cache.move_to_end(asset_hash)
+    while len(_hash_exists_cache) > _HASH_EXISTS_MAX:
+        _hash_exists_cache.popitem(last=False)
+
+
 def _validation_error_response(code: str, ve: ValidationError) -> web.Response:
-    return _error_response(400, code, "Validation failed.", {"errors": ve.json()})
+    return _error_response(400, code, "Validation failed.", {"errors": ve.errors(include_url=False, include_context=False)})
+
+
+def _is_invalid_json(ve: ValidationError) -> bool:
+    return any(err["type"] == "json_invalid" for err in ve.errors())
+
+
+def _delete_temp_file_if_exists(tmp_path: str | None) -> None:
+    if tmp_path and os.path.exists(tmp_path):
+        os.remove(tmp_path)
 
 
 @ROUTES.head("/api/assets/hash/{hash}")
@@ -43,9 +104,9 @@ async def head_asset_by_hash(request: web.Request) -> web.Response:
     if not hash_str or ":" not in hash_str:
         return _error_response(400, "INVALID_HASH", "hash must be like 'blake3:<hex>'")
     algo, digest = hash_str.split(":", 1)
-    if algo != "blake3" or not digest or any(c for c in digest if c not in "0123456789abcdef"):
+    if algo != "blake3" or not digest or not is_lower_hex(digest):
         return _error_response(400, "INVALID_HASH", "hash must be like 'blake3:<hex>'")
-    exists = manager.asset_exists(asset_hash=hash_str)
+    exists = _cached_asset_exists(hash_str)
     return web.Response(status=200 if exists else 404)
 
 
@@ -60,6 +121,13 @@ async def list_assets(request: web.Request) -> web.Response:
     except ValidationError as ve:
         return _validation_error_response("INVALID_QUERY", ve)
 
+    after = None
+    if q.cursor:
+        try:
+            after = manager.decode_list_cursor(q.sort, q.cursor)
+        except ValueError as ve:
+            return _error_response(400, "INVALID_CURSOR", str(ve))
+
     payload = manager.list_assets(
         include_tags=q.include_tags,
         exclude_tags=q.exclude_tags,
@@ -69,21 +137,24 @@ async def list_assets(request: web.Request) -> web.Response:
         offset=q.offset,
         sort=q.sort,
         order=q.order,
+        after=after,
+        include_total=q.include_total,
         owner_id=USER_MANAGER.get_request_user_id(request),
     )
-    return web.json_response(payload.model_dump(mode="json", exclude_none=True))
+    return web.json_response(payload)
 
 
-@ROUTES.get(f"/api/assets/{{id:{UUID_RE}}}")
+@ROUTES.get(_ASSET_PATH)
 async def get_asset(request: web.Request) -> web.Response:
     """
     GET request to get an asset's info as JSON.
     """
-    asset_info_id = str(uuid.UUID(request.match_info["id"]))
+    asset_info_id = _match_uuid(request)
+    owner_id = USER_MANAGER.get_request_user_id(request)
     try:
         result = manager.get_asset(
             asset_info_id=asset_info_id,
-            owner_id=USER_MANAGER.get_request_user_id(request),
+            owner_id=owner_id,
         )
     except ValueError as e:
         return _error_response(404, "ASSET_NOT_FOUND", str(e), {"id": asset_info_id})
@@ -91,22 +162,34 @@ async def get_asset(request: web.Request) -> web.Response:
         logging.exception(
             "get_asset failed for asset_info_id=%s, owner_id=%s",
             asset_info_id,
-            USER_MANAGER.get_request_user_id(request),
+            owner_id,
         )
         return _error_response(500, "INTERNAL", "Unexpected server error.")
-    return web.json_response(result.model_dump(mode="json"), status=200)
+
+    body = result.model_dump_json()
+    etag = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+    if _if_none_match(request, etag):
+        resp = web.Response(status=304, headers={"Cache-Control": _REVALIDATE_CACHE_CONTROL})
+    else:
+        resp = web.Response(
+            text=body,
+            content_type="application/json",
+            headers={"Cache-Control": _REVALIDATE_CACHE_CONTROL},
+        )
+    resp.etag = etag
+    return resp
 
 
-@ROUTES.get(f"/api/assets/{{id:{UUID_RE}}}/content")
-async def download_asset_content(request: web.Request) -> web.Response:
+@ROUTES.get(f"{_ASSET_PATH}/content")
+async def download_asset_content(request: web.Request) -> web.StreamResponse:
     # question: do we need disposition? could we just stick with one of these?
     disposition = request.query.get("disposition", "attachment").lower().strip()
-    if disposition not in {"inline", "attachment"}:
+    if disposition not in _DISPOSITIONS:
         disposition = "attachment"
 
     try:
         abs_path, content_type, filename = manager.resolve_asset_content_for_download(
-            asset_info_id=str(uuid.UUID(request.match_info["id"])),
+            asset_info_id=_match_uuid(request),
             owner_id=USER_MANAGER.get_request_user_id(request),
         )
     except ValueError as ve:
@@ -116,34 +199,29 @@ async def download_asset_content(request: web.Request) -> web.Response:
     except FileNotFoundError:
         return _error_response(404, "FILE_NOT_FOUND", "Underlying file not found on disk.")
 
-    quoted = (filename or "").replace("\r", "").replace("\n", "").replace('"', "'")
+    quoted = (filename or "").translate(_CD_FILENAME_SANITIZE)
     cd = f'{disposition}; filename="{quoted}"; filename*=UTF-8\'\'{urllib.parse.quote(filename)}'
 
-    file_size = os.path.getsize(abs_path)
-    logging.info(
-        "download_asset_content: path=%s, size=%d bytes (%.2f MB), content_type=%s, filename=%s",
-        abs_path,
-        file_size,
-        file_size / (1024 * 1024),
-        content_type,
-        filename,
-    )
+    # the size is only needed for this log line; FileResponse stats the file itself
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        file_size = await asyncio.to_thread(os.path.getsize, abs_path)
+        logging.info(
+            "download_asset_content: path=%s, size=%d bytes (%.2f MB), content_type=%s, filename=%s",
+            abs_path,
+            file_size,
+            file_size / (1024 * 1024),
+            content_type,
+            filename,
+        )
 
-    async def file_sender():
-        chunk_size = 64 * 1024
-        with open(abs_path, "rb") as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                yield chunk
-
-    return web.Response(
-        body=file_sender(),
-        content_type=content_type,
+    # FileResponse sets ETag/Last-Modified from the file and answers If-None-Match with 304 itself
+    return web.FileResponse(
+        abs_path,
+        chunk_size=256 * 1024,
         headers={
+            "Cache-Control": _REVALIDATE_CACHE_CONTROL,
             "Content-Disposition": cd,
-            "Content-Length": str(file_size),
+            "Content-Type": content_type,
         },
     )
 
@@ -151,9 +229,10 @@ async def download_asset_content(request: web.Request) -> web.Response:
 @ROUTES.post("/api/assets/from-hash")
 async def create_asset_from_hash(request: web.Request) -> web.Response:
     try:
-        payload = await request.json()
-        body = schemas_in.CreateFromHashBody.model_validate(payload)
+        body = schemas_in.CreateFromHashBody.model_validate_json(await request.read())
     except ValidationError as ve:
+        if _is_invalid_json(ve):
+            return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
         return _validation_error_response("INVALID_BODY", ve)
     except Exception:
         return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
@@ -167,7 +246,8 @@ async def create_asset_from_hash(request: web.Request) -> web.Response:
     )
     if result is None:
         return _error_response(404, "ASSET_NOT_FOUND", f"Asset content {body.hash} does not exist")
-    return web.json_response(result.model_dump(mode="json"), status=201)
+    _remember_asset_hash(result.asset_hash, True)
+    return _model_response(result, status=201)
 
 
 @ROUTES.post("/api/assets")
@@ -205,7 +285,7 @@ async def upload_asset(request: web.Request) -> web.Response:
                 if ":" not in s:
                     return _error_response(400, "INVALID_HASH", "hash must be like 'blake3:<hex>'")
                 algo, digest = s.split(":", 1)
-                if algo != "blake3" or not digest or any(c for c in digest if c not in "0123456789abcdef"):
+                if algo != "blake3" or not digest or not is_lower_hex(digest):
                     return _error_response(400, "INVALID_HASH", "hash must be like 'blake3:<hex>'")
                 provided_hash = f"{algo}:{digest}"
                 try:
@@ -232,21 +312,23 @@ async def upload_asset(request: web.Request) -> web.Response:
             # Otherwise, store to temp for hashing/ingest
             uploads_root = os.path.join(folder_paths.get_temp_directory(), "uploads")
             unique_dir = os.path.join(uploads_root, uuid.uuid4().hex)
-            os.makedirs(unique_dir, exist_ok=True)
+            await asyncio.to_thread(os.makedirs, unique_dir, exist_ok=True)
             tmp_path = os.path.join(unique_dir, ".upload.part")
 
             try:
-                with open(tmp_path, "wb") as f:
+                f = await asyncio.to_thread(open, tmp_path, "wb")
+                try:
                     while True:
                         chunk = await field.read_chunk(8 * 1024 * 1024)
                         if not chunk:
                             break
-                        f.write(chunk)
+                        await asyncio.to_thread(f.write, chunk)
                         file_written += len(chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
             except Exception:
                 try:
-                    if os.path.exists(tmp_path or ""):
-                        os.remove(tmp_path)
+                    await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
                 finally:
                     return _error_response(500, "UPLOAD_IO_ERROR", "Failed to receive and store uploaded file.")
         elif fname == "tags":
@@ -263,8 +345,7 @@ async def upload_asset(request: web.Request) -> web.Response:
     if file_present and file_written == 0 and not (provided_hash and provided_hash_exists):
         # Empty upload is only acceptable if we are fast-pathing from existing hash
         try:
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
         finally:
             return _error_response(400, "EMPTY_UPLOAD", "Uploaded file is empty.")
 
@@ -277,16 +358,14 @@ async def upload_asset(request: web.Request) -> web.Response:
         })
     except ValidationError as ve:
         try:
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
         finally:
             return _validation_error_response("INVALID_BODY", ve)
 
     # Validate models category against configured folders (consistent with previous behavior)
     if spec.tags and spec.tags[0] == "models":
         if len(spec.tags) < 2 or spec.tags[1] not in folder_paths.folder_names_and_paths:
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
             return _error_response(
                 400, "INVALID_BODY", f"unknown models category '{spec.tags[1] if len(spec.tags) >= 2 else ''}'"
             )
@@ -311,15 +390,15 @@ async def upload_asset(request: web.Request) -> web.Response:
             return _error_response(404, "ASSET_NOT_FOUND", f"Asset content {spec.hash} does not exist")
 
         # Drain temp if we accidentally saved (e.g., hash field came after file)
-        if tmp_path and os.path.exists(tmp_path):
-            with contextlib.suppress(Exception):
-                os.remove(tmp_path)
+        with contextlib.suppress(Exception):
+            await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
 
         status = 200 if (not result.created_new) else 201
-        return web.json_response(result.model_dump(mode="json"), status=status)
+        _remember_asset_hash(result.asset_hash, True)
+        return _model_response(result, status=status)
 
     # Otherwise, we must have a temp file path to ingest
-    if not tmp_path or not os.path.exists(tmp_path):
+    if not tmp_path or not await asyncio.to_thread(os.path.exists, tmp_path):
         # The only case we reach here without a temp file is: client sent a hash that does not exist and no file
         return _error_response(404, "ASSET_NOT_FOUND", "Provided hash not found and no file uploaded.")
 
@@ -332,10 +411,10 @@ async def upload_asset(request: web.Request) -> web.Response:
             expected_asset_hash=spec.hash,
         )
         status = 201 if created.created_new else 200
-        return web.json_response(created.model_dump(mode="json"), status=status)
+        _remember_asset_hash(created.asset_hash, True)
+        return _model_response(created, status=status)
     except ValueError as e:
-        if tmp_path and os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
         msg = str(e)
         if "HASH_MISMATCH" in msg or msg.strip().upper() == "HASH_MISMATCH":
             return _error_response(
@@ -345,18 +424,20 @@ async def upload_asset(request: web.Request) -> web.Response:
             )
         return _error_response(400, "BAD_REQUEST", "Invalid inputs.")
     except Exception:
-        if tmp_path and os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        await asyncio.to_thread(_delete_temp_file_if_exists, tmp_path)
         logging.exception("upload_asset_from_temp_path failed for tmp_path=%s, owner_id=%s", tmp_path, owner_id)
         return _error_response(500, "INTERNAL", "Unexpected server error.")
 
 
-@ROUTES.put(f"/api/assets/{{id:{UUID_RE}}}")
+@ROUTES.put(_ASSET_PATH)
 async def update_asset(request: web.Request) -> web.Response:
-    asset_info_id = str(uuid.UUID(request.match_info["id"]))
+    asset_info_id = _match_uuid(request)
+    owner_id = USER_MANAGER.get_request_user_id(request)
     try:
-        body = schemas_in.UpdateAssetBody.model_validate(await request.json())
+        body = schemas_in.UpdateAssetBody.model_validate_json(await request.read())
     except ValidationError as ve:
+        if _is_invalid_json(ve):
+            return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
         return _validation_error_response("INVALID_BODY", ve)
     except Exception:
         return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
@@ -366,7 +447,7 @@ async def update_asset(request: web.Request) -> web.Response:
             asset_info_id=asset_info_id,
             name=body.name,
             user_metadata=body.user_metadata,
-            owner_id=USER_MANAGER.get_request_user_id(request),
+            owner_id=owner_id,
         )
     except (ValueError, PermissionError) as ve:
         return _error_response(404, "ASSET_NOT_FOUND", str(ve), {"id": asset_info_id})
@@ -374,34 +455,37 @@ async def update_asset(request: web.Request) -> web.Response:
         logging.exception(
             "update_asset failed for asset_info_id=%s, owner_id=%s",
             asset_info_id,
-            USER_MANAGER.get_request_user_id(request),
+            owner_id,
         )
         return _error_response(500, "INTERNAL", "Unexpected server error.")
-    return web.json_response(result.model_dump(mode="json"), status=200)
+    return _model_response(result, status=200)
 
 
-@ROUTES.delete(f"/api/assets/{{id:{UUID_RE}}}")
+@ROUTES.delete(_ASSET_PATH)
 async def delete_asset(request: web.Request) -> web.Response:
-    asset_info_id = str(uuid.UUID(request.match_info["id"]))
+    asset_info_id = _match_uuid(request)
+    owner_id = USER_MANAGER.get_request_user_id(request)
     delete_content = request.query.get("delete_content")
-    delete_content = True if delete_content is None else delete_content.lower() not in {"0", "false", "no"}
+    delete_content = True if delete_content is None else delete_content.lower() not in _FALSEY
 
     try:
         deleted = manager.delete_asset_reference(
             asset_info_id=asset_info_id,
-            owner_id=USER_MANAGER.get_request_user_id(request),
+            owner_id=owner_id,
             delete_content_if_orphan=delete_content,
         )
     except Exception:
         logging.exception(
             "delete_asset_reference failed for asset_info_id=%s, owner_id=%s",
             asset_info_id,
-            USER_MANAGER.get_request_user_id(request),
+            owner_id,
         )
         return _error_response(500, "INTERNAL", "Unexpected server error.")
 
     if not deleted:
         return _error_response(404, "ASSET_NOT_FOUND", f"AssetInfo {asset_info_id} not found.")
+    # the deleted info may have taken its content with it; we don't know which hash, so drop them all
+    _hash_exists_cache.clear()
     return web.Response(status=204)
 
 
@@ -410,13 +494,12 @@ async def get_tags(request: web.Request) -> web.Response:
     """
     GET request to list all tags based on query parameters.
     """
-    query_map = dict(request.rel_url.query)
-
     try:
-        query = schemas_in.TagsListQuery.model_validate(query_map)
+        # every TagsListQuery field is scalar, so the MultiDict can be validated as-is
+        query = schemas_in.TagsListQuery.model_validate(request.query)
     except ValidationError as e:
         return web.json_response(
-            {"error": {"code": "INVALID_QUERY", "message": "Invalid query parameters", "details": e.errors()}},
+            {"error": {"code": "INVALID_QUERY", "message": "Invalid query parameters", "details": e.errors(include_url=False)}},
             status=400,
         )
 
@@ -428,17 +511,19 @@ async def get_tags(request: web.Request) -> web.Response:
         include_zero=query.include_zero,
         owner_id=USER_MANAGER.get_request_user_id(request),
     )
-    return web.json_response(result.model_dump(mode="json"))
+    return web.json_response(result)
 
 
-@ROUTES.post(f"/api/assets/{{id:{UUID_RE}}}/tags")
+@ROUTES.post(f"{_ASSET_PATH}/tags")
 async def add_asset_tags(request: web.Request) -> web.Response:
-    asset_info_id = str(uuid.UUID(request.match_info["id"]))
+    asset_info_id = _match_uuid(request)
+    owner_id = USER_MANAGER.get_request_user_id(request)
     try:
-        payload = await request.json()
-        data = schemas_in.TagsAdd.model_validate(payload)
+        data = schemas_in.TagsAdd.model_validate_json(await request.read())
     except ValidationError as ve:
-        return _error_response(400, "INVALID_BODY", "Invalid JSON body for tags add.", {"errors": ve.errors()})
+        if _is_invalid_json(ve):
+            return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
+        return _error_response(400, "INVALID_BODY", "Invalid JSON body for tags add.", {"errors": ve.errors(include_url=False)})
     except Exception:
         return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
 
@@ -447,7 +532,7 @@ async def add_asset_tags(request: web.Request) -> web.Response:
             asset_info_id=asset_info_id,
             tags=data.tags,
             origin="manual",
-            owner_id=USER_MANAGER.get_request_user_id(request),
+            owner_id=owner_id,
         )
     except (ValueError, PermissionError) as ve:
         return _error_response(404, "ASSET_NOT_FOUND", str(ve), {"id": asset_info_id})
@@ -455,21 +540,23 @@ async def add_asset_tags(request: web.Request) -> web.Response:
         logging.exception(
             "add_tags_to_asset failed for asset_info_id=%s, owner_id=%s",
             asset_info_id,
-            USER_MANAGER.get_request_user_id(request),
+            owner_id,
         )
         return _error_response(500, "INTERNAL", "Unexpected server error.")
 
-    return web.json_response(result.model_dump(mode="json"), status=200)
+    return _model_response(result, status=200)
 
 
-@ROUTES.delete(f"/api/assets/{{id:{UUID_RE}}}/tags")
+@ROUTES.delete(f"{_ASSET_PATH}/tags")
 async def delete_asset_tags(request: web.Request) -> web.Response:
-    asset_info_id = str(uuid.UUID(request.match_info["id"]))
+    asset_info_id = _match_uuid(request)
+    owner_id = USER_MANAGER.get_request_user_id(request)
     try:
-        payload = await request.json()
-        data = schemas_in.TagsRemove.model_validate(payload)
+        data = schemas_in.TagsRemove.model_validate_json(await request.read())
     except ValidationError as ve:
-        return _error_response(400, "INVALID_BODY", "Invalid JSON body for tags remove.", {"errors": ve.errors()})
+        if _is_invalid_json(ve):
+            return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
+        return _error_response(400, "INVALID_BODY", "Invalid JSON body for tags remove.", {"errors": ve.errors(include_url=False)})
     except Exception:
         return _error_response(400, "INVALID_JSON", "Request body must be valid JSON.")
 
@@ -477,7 +564,7 @@ async def delete_asset_tags(request: web.Request) -> web.Response:
         result = manager.remove_tags_from_asset(
             asset_info_id=asset_info_id,
             tags=data.tags,
-            owner_id=USER_MANAGER.get_request_user_id(request),
+            owner_id=owner_id,
         )
     except ValueError as ve:
         return _error_response(404, "ASSET_NOT_FOUND", str(ve), {"id": asset_info_id})
@@ -485,11 +572,11 @@ async def delete_asset_tags(request: web.Request) -> web.Response:
         logging.exception(
             "remove_tags_from_asset failed for asset_info_id=%s, owner_id=%s",
             asset_info_id,
-            USER_MANAGER.get_request_user_id(request),
+            owner_id,
         )
         return _error_response(500, "INTERNAL", "Unexpected server error.")
 
-    return web.json_response(result.model_dump(mode="json"), status=200)
+    return _model_response(result, status=200)
 
 
 @ROUTES.post("/api/assets/seed")
@@ -501,12 +588,12 @@ async def seed_assets_endpoint(request: web.Request) -> web.Response:
     except Exception:
         roots = ["models", "input", "output"]
 
-    valid_roots = [r for r in roots if r in ("models", "input", "output")]
+    valid_roots = [r for r in roots if r in ALLOWED_ROOTS]
     if not valid_roots:
         return _error_response(400, "INVALID_BODY", "No valid roots specified")
 
     try:
-        seed_assets(tuple(valid_roots))
+        await asyncio.to_thread(seed_assets, tuple(valid_roots))
     except Exception:
         logging.exception("seed_assets failed for roots=%s", valid_roots)
         return _error_response(500, "INTERNAL", "Seed operation failed")
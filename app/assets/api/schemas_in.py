@@ -10,6 +10,9 @@ from pydantic import (
     model_validator,
 )
 
+from app.assets.helpers import is_lower_hex
+
+
 class ListAssetsQuery(BaseModel):
     include_tags: list[str] = Field(default_factory=list)
     exclude_tags: list[str] = Field(default_factory=list)
@@ -20,6 +23,9 @@ class ListAssetsQuery(BaseModel):
 
     limit: conint(ge=1, le=500) = 20
     offset: conint(ge=0) = 0
+    # opaque keyset cursor from a previous page's next_cursor; replaces offset when set
+    cursor: str | None = None
+    include_total: bool = True
 
     sort: Literal["name", "created_at", "updated_at", "size", "last_access_time"] = "created_at"
     order: Literal["asc", "desc"] = "desc"
@@ -84,7 +90,7 @@ class CreateFromHashBody(BaseModel):
         algo, digest = s.split(":", 1)
         if algo != "blake3":
             raise ValueError("only canonical 'blake3:<hex>' is accepted here")
-        if not digest or any(c for c in digest if c not in "0123456789abcdef"):
+        if not digest or not is_lower_hex(digest):
             raise ValueError("hash digest must be lowercase hex")
         return s
 
@@ -183,7 +189,7 @@ class UploadAssetSpec(BaseModel):
         algo, digest = s.split(":", 1)
         if algo != "blake3":
             raise ValueError("only canonical 'blake3:<hex>' is accepted here")
-        if not digest or any(c for c in digest if c not in "0123456789abcdef"):
+        if not digest or not is_lower_hex(digest):
             raise ValueError("hash digest must be lowercase hex")
         return f"{algo}:{digest}"
 
@@ -4,6 +4,9 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
+# AssetsList and TagsList (with their items) are the reference shapes for GET /api/assets and /api/tags.
+# The manager builds those pages as plain dicts for speed; the asset tests round-trip responses through
+# these models, so a field added on one side only fails there.
 class AssetSummary(BaseModel):
     id: str
     name: str
@@ -25,8 +28,9 @@ class AssetSummary(BaseModel):
 
 class AssetsList(BaseModel):
     assets: list[AssetSummary]
-    total: int
+    total: int | None = None
     has_more: bool
+    next_cursor: str | None = None
 
 
 class AssetUpdated(BaseModel):
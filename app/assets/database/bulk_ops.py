@@ -1,28 +1,66 @@
 import os
-import uuid
 import sqlalchemy
-from typing import Iterable
+from typing import Any
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects import sqlite
 
-from app.assets.helpers import utcnow
+from app.assets.helpers import utcnow, uuid7
 from app.assets.database.models import Asset, AssetCacheState, AssetInfo, AssetInfoTag, AssetInfoMeta
 
 MAX_BIND_PARAMS = 800
 
-def _chunk_rows(rows: list[dict], cols_per_row: int, max_bind_params: int) -> Iterable[list[dict]]:
-    if not rows:
-        return []
-    rows_per_stmt = max(1, max_bind_params // max(1, cols_per_row))
-    for i in range(0, len(rows), rows_per_stmt):
-        yield rows[i:i + rows_per_stmt]
-
-def _iter_chunks(seq, n: int):
+def iter_chunks(seq, n: int):
     for i in range(0, len(seq), n):
         yield seq[i:i + n]
 
-def _rows_per_stmt(cols: int) -> int:
-    return max(1, MAX_BIND_PARAMS // max(1, cols))
+
+def _executemany(session: Session, stmt, rows: list[dict]) -> None:
+    """Run a single-row INSERT once per row through one DBAPI executemany().
+
+    The statement is compiled once and rows are bound positionally through the column types' bind
+    processors, skipping SQLAlchemy's per-row parameter setup. Each row is its own parameter set, so
+    no chunking against the bind-variable limit is needed. Columns missing from the rows take their
+    scalar Python-side default; keys that aren't columns are ignored.
+    """
+    if not rows:
+        return
+    conn = session.connection()
+    dialect = conn.dialect
+    table = stmt.table
+    compiled = stmt.compile(dialect=dialect, column_keys=[c.key for c in table.c if c.key in rows[0]])
+    keys = compiled.positiontup
+    consts: dict[str, Any] = {}
+    for k in keys:
+        if k not in rows[0]:
+            default = table.c[k].default
+            if default is None or not default.is_scalar:
+                raise KeyError(f"bulk insert rows carry no value for {table.name}.{k}")
+            consts[k] = default.arg
+    procs = [compiled.binds[k].type.bind_processor(dialect) for k in keys]
+    if consts:
+        # defaults are bound once up front rather than copied into every row
+        fixed = {k: p(consts[k]) if p else consts[k] for k, p in zip(keys, procs) if k in consts}
+        params = [
+            tuple(fixed[k] if k in fixed else p(r[k]) if p else r[k] for k, p in zip(keys, procs))
+            for r in rows
+        ]
+    elif any(procs):
+        params = [tuple(p(r[k]) if p else r[k] for k, p in zip(keys, procs)) for r in rows]
+    else:
+        params = [tuple(r[k] for k in keys) for r in rows]
+    conn.exec_driver_sql(str(compiled), params)
+
+
+# per-connection scratch table of lookup keys, joined against instead of chunked IN lists
+_SEED_KEYS = sqlalchemy.table("_seed_keys", sqlalchemy.column("k"), sqlalchemy.column("v"))
+
+
+def _load_seed_keys(session: Session, pairs: list[tuple[str, str | None]]) -> None:
+    """Replace the contents of the _seed_keys temp table with the given (k, v) pairs."""
+    conn = session.connection()
+    conn.exec_driver_sql("CREATE TEMP TABLE IF NOT EXISTS _seed_keys (k TEXT NOT NULL, v TEXT)")
+    conn.exec_driver_sql("DELETE FROM _seed_keys")
+    conn.exec_driver_sql("INSERT INTO _seed_keys (k, v) VALUES (?, ?)", pairs)
 
 
 def seed_from_paths_batch(
@@ -51,8 +89,8 @@ def seed_from_paths_batch(
 
     for sp in specs:
         ap = os.path.abspath(sp["abs_path"])
-        aid = str(uuid.uuid4())
-        iid = str(uuid.uuid4())
+        aid = uuid7()
+        iid = uuid7()
         path_list.append(ap)
         path_to_asset[ap] = aid
 
@@ -87,9 +125,7 @@ def seed_from_paths_batch(
         }
 
     # insert all seed Assets (hash=NULL)
-    ins_asset = sqlite.insert(Asset)
-    for chunk in _iter_chunks(asset_rows, _rows_per_stmt(5)):
-        session.execute(ins_asset, chunk)
+    _executemany(session, sqlite.insert(Asset), asset_rows)
 
     # try to claim AssetCacheState (file_path)
     # Insert with ON CONFLICT DO NOTHING, then query to find which paths were actually inserted
@@ -97,25 +133,23 @@ def seed_from_paths_batch(
         sqlite.insert(AssetCacheState)
         .on_conflict_do_nothing(index_elements=[AssetCacheState.file_path])
     )
-    for chunk in _iter_chunks(state_rows, _rows_per_stmt(3)):
-        session.execute(ins_state, chunk)
-
-    # Query to find which of our paths won (were actually inserted)
-    winners_by_path: set[str] = set()
-    for chunk in _iter_chunks(path_list, MAX_BIND_PARAMS):
-        result = session.execute(
-            sqlalchemy.select(AssetCacheState.file_path)
-            .where(AssetCacheState.file_path.in_(chunk))
-            .where(AssetCacheState.asset_id.in_([path_to_asset[p] for p in chunk]))
-        )
-        winners_by_path.update(result.scalars().all())
+    _executemany(session, ins_state, state_rows)
+
+    # Find which of our paths won (their state row carries the asset_id we generated)
+    _load_seed_keys(session, list(path_to_asset.items()))
+    sel_winners = sqlalchemy.select(AssetCacheState.file_path).join(
+        _SEED_KEYS,
+        sqlalchemy.and_(AssetCacheState.file_path == _SEED_KEYS.c.k, AssetCacheState.asset_id == _SEED_KEYS.c.v),
+    )
+    winners_by_path: set[str] = set(session.execute(sel_winners).scalars().all())
 
     all_paths_set = set(path_list)
     losers_by_path = all_paths_set - winners_by_path
     lost_assets = [path_to_asset[p] for p in losers_by_path]
     if lost_assets:  # losers get their Asset removed
-        for id_chunk in _iter_chunks(lost_assets, MAX_BIND_PARAMS):
-            session.execute(sqlalchemy.delete(Asset).where(Asset.id.in_(id_chunk)))
+        del_assets = sqlalchemy.delete(Asset).where(Asset.id.in_(sqlalchemy.bindparam("ids", expanding=True)))
+        for id_chunk in iter_chunks(lost_assets, MAX_BIND_PARAMS):
+            session.execute(del_assets, {"ids": id_chunk})
 
     if not winners_by_path:
         return {"inserted_infos": 0, "won_states": 0, "lost_states": len(losers_by_path)}
@@ -127,17 +161,12 @@ def seed_from_paths_batch(
         sqlite.insert(AssetInfo)
         .on_conflict_do_nothing(index_elements=[AssetInfo.asset_id, AssetInfo.owner_id, AssetInfo.name])
     )
-    for chunk in _iter_chunks(winner_info_rows, _rows_per_stmt(9)):
-        session.execute(ins_info, chunk)
-
-    # Query to find which info rows were actually inserted (by matching our generated IDs)
-    all_info_ids = [row["id"] for row in winner_info_rows]
-    inserted_info_ids: set[str] = set()
-    for chunk in _iter_chunks(all_info_ids, MAX_BIND_PARAMS):
-        result = session.execute(
-            sqlalchemy.select(AssetInfo.id).where(AssetInfo.id.in_(chunk))
-        )
-        inserted_info_ids.update(result.scalars().all())
+    _executemany(session, ins_info, winner_info_rows)
+
+    # Find which info rows were actually inserted (by matching our generated IDs)
+    _load_seed_keys(session, [(row["id"], None) for row in winner_info_rows])
+    sel_infos = sqlalchemy.select(AssetInfo.id).join(_SEED_KEYS, AssetInfo.id == _SEED_KEYS.c.k)
+    inserted_info_ids: set[str] = set(session.execute(sel_infos).scalars().all())
 
     # build and insert tag + meta rows for the AssetInfo
     tag_rows: list[dict] = []
@@ -167,7 +196,7 @@ def seed_from_paths_batch(
                     }
                 )
 
-    bulk_insert_tags_and_meta(session, tag_rows=tag_rows, meta_rows=meta_rows, max_bind_params=MAX_BIND_PARAMS)
+    bulk_insert_tags_and_meta(session, tag_rows=tag_rows, meta_rows=meta_rows)
     return {
         "inserted_infos": len(inserted_info_ids),
         "won_states": len(winners_by_path),
@@ -180,7 +209,6 @@ def bulk_insert_tags_and_meta(
     *,
     tag_rows: list[dict],
     meta_rows: list[dict],
-    max_bind_params: int,
 ) -> None:
     """Batch insert into asset_info_tags and asset_info_meta with ON CONFLICT DO NOTHING.
     - tag_rows keys: asset_info_id, tag_name, origin, added_at
@@ -191,8 +219,7 @@ def bulk_insert_tags_and_meta(
             sqlite.insert(AssetInfoTag)
             .on_conflict_do_nothing(index_elements=[AssetInfoTag.asset_info_id, AssetInfoTag.tag_name])
         )
-        for chunk in _chunk_rows(tag_rows, cols_per_row=4, max_bind_params=max_bind_params):
-            session.execute(ins_links, chunk)
+        _executemany(session, ins_links, tag_rows)
     if meta_rows:
         ins_meta = (
             sqlite.insert(AssetInfoMeta)
@@ -200,5 +227,4 @@ def bulk_insert_tags_and_meta(
                 index_elements=[AssetInfoMeta.asset_info_id, AssetInfoMeta.key, AssetInfoMeta.ordinal]
             )
         )
-        for chunk in _chunk_rows(meta_rows, cols_per_row=7, max_bind_params=max_bind_params):
-            session.execute(ins_meta, chunk)
+        _executemany(session, ins_meta, meta_rows)
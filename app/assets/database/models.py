@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import uuid
 from datetime import datetime
 
-from typing import Any
+from typing import Any, Sequence
 from sqlalchemy import (
     JSON,
     BigInteger,
@@ -17,17 +16,19 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    inspect,
+    text,
 )
 from sqlalchemy.orm import Mapped, foreign, mapped_column, relationship
 
-from app.assets.helpers import utcnow
+from app.assets.helpers import utcnow, uuid7
 from app.database.models import to_dict, Base
 
 
 class Asset(Base):
     __tablename__ = "assets"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7)
     hash: Mapped[str | None] = mapped_column(String(256), nullable=True)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     mime_type: Mapped[str | None] = mapped_column(String(255))
@@ -59,7 +60,8 @@ class Asset(Base):
     )
 
     __table_args__ = (
-        Index("uq_assets_hash", "hash", unique=True),
+        Index("uq_assets_hash", "hash", unique=True, sqlite_where=text("hash IS NOT NULL")),
+        Index("ix_assets_unhashed", "id", sqlite_where=text("hash IS NULL")),
         Index("ix_assets_mime_type", "mime_type"),
         CheckConstraint("size_bytes >= 0", name="ck_assets_size_nonneg"),
     )
@@ -83,7 +85,6 @@ class AssetCacheState(Base):
     asset: Mapped[Asset] = relationship(back_populates="cache_states")
 
     __table_args__ = (
-        Index("ix_asset_cache_state_file_path", "file_path"),
         Index("ix_asset_cache_state_asset_id", "asset_id"),
         CheckConstraint("(mtime_ns IS NULL) OR (mtime_ns >= 0)", name="ck_acs_mtime_nonneg"),
         UniqueConstraint("file_path", name="uq_asset_cache_state_file_path"),
@@ -99,7 +100,7 @@ class AssetCacheState(Base):
 class AssetInfo(Base):
     __tablename__ = "assets_info"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=uuid7)
     owner_id: Mapped[str] = mapped_column(String(128), nullable=False, default="")
     name: Mapped[str] = mapped_column(String(512), nullable=False)
     asset_id: Mapped[str] = mapped_column(String(36), ForeignKey("assets.id", ondelete="RESTRICT"), nullable=False)
@@ -113,7 +114,7 @@ class AssetInfo(Base):
         "Asset",
         back_populates="infos",
         foreign_keys=[asset_id],
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     preview_asset: Mapped[Asset | None] = relationship(
         "Asset",
@@ -137,7 +138,7 @@ class AssetInfo(Base):
     tags: Mapped[list[Tag]] = relationship(
         secondary="asset_info_tags",
         back_populates="asset_infos",
-        lazy="selectin",
+        lazy="raise_on_sql",
         viewonly=True,
         overlaps="tag_links,asset_info_links,asset_infos,tag",
     )
@@ -145,16 +146,19 @@ class AssetInfo(Base):
     __table_args__ = (
         UniqueConstraint("asset_id", "owner_id", "name", name="uq_assets_info_asset_owner_name"),
         Index("ix_assets_info_owner_name", "owner_id", "name"),
-        Index("ix_assets_info_owner_id", "owner_id"),
-        Index("ix_assets_info_asset_id", "asset_id"),
         Index("ix_assets_info_name", "name"),
-        Index("ix_assets_info_created_at", "created_at"),
-        Index("ix_assets_info_last_access_time", "last_access_time"),
+        Index("ix_assets_info_owner_created_at", "owner_id", "created_at", "id"),
+        Index("ix_assets_info_owner_updated_at", "owner_id", "updated_at", "id"),
+        Index("ix_assets_info_owner_last_access_time", "owner_id", "last_access_time", "id"),
     )
 
-    def to_dict(self, include_none: bool = False) -> dict[str, Any]:
+    def to_dict(self, include_none: bool = False, tags: Sequence[str] | None = None) -> dict[str, Any]:
+        """``tags`` defaults to the eager-loaded relationship; it is omitted when that was not loaded."""
         data = to_dict(self, include_none=include_none)
-        data["tags"] = [t.name for t in self.tags]
+        if tags is None and "tags" not in inspect(self).unloaded:
+            tags = [t.name for t in self.tags]
+        if tags is not None:
+            data["tags"] = list(tags)
         return data
 
     def __repr__(self) -> str:
@@ -178,10 +182,9 @@ class AssetInfoMeta(Base):
     asset_info: Mapped[AssetInfo] = relationship(back_populates="metadata_entries")
 
     __table_args__ = (
-        Index("ix_asset_info_meta_key", "key"),
-        Index("ix_asset_info_meta_key_val_str", "key", "val_str"),
-        Index("ix_asset_info_meta_key_val_num", "key", "val_num"),
-        Index("ix_asset_info_meta_key_val_bool", "key", "val_bool"),
+        Index("ix_asset_info_meta_key_val_str", "key", "val_str", sqlite_where=text("val_str IS NOT NULL")),
+        Index("ix_asset_info_meta_key_val_num", "key", "val_num", sqlite_where=text("val_num IS NOT NULL")),
+        Index("ix_asset_info_meta_key_val_bool", "key", "val_bool", sqlite_where=text("val_bool IS NOT NULL")),
     )
 
 
@@ -203,8 +206,7 @@ class AssetInfoTag(Base):
     tag: Mapped[Tag] = relationship(back_populates="asset_info_links")
 
     __table_args__ = (
-        Index("ix_asset_info_tags_tag_name", "tag_name"),
-        Index("ix_asset_info_tags_asset_info_id", "asset_info_id"),
+        Index("ix_asset_info_tags_tag_name_info", "tag_name", "asset_info_id"),
     )
 
 
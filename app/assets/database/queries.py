@@ -1,22 +1,28 @@
 import os
+import json
 import logging
 import sqlalchemy as sa
-from collections import defaultdict
 from datetime import datetime
-from typing import Iterable, Any
+from functools import lru_cache
+from typing import Any
 from sqlalchemy import select, delete, exists, func
 from sqlalchemy.dialects import sqlite
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, contains_eager, noload
+from app.assets.database.bulk_ops import MAX_BIND_PARAMS, iter_chunks
 from app.assets.database.models import Asset, AssetInfo, AssetCacheState, AssetInfoMeta, AssetInfoTag, Tag
+from app.assets.database.tags import ensure_tags_exist
 from app.assets.helpers import (
     compute_relative_filename, escape_like_prefix, normalize_tags, project_kv, utcnow
 )
 from typing import Sequence
 
 
+@lru_cache(maxsize=256)
 def visible_owner_clause(owner_id: str) -> sa.sql.ClauseElement:
-    """Build owner visibility predicate for reads. Owner-less rows are visible to everyone."""
+    """Build owner visibility predicate for reads. Owner-less rows are visible to everyone.
+
+    Clause elements are immutable, so one instance per owner is shared across statements.
+    """
     owner_id = (owner_id or "").strip()
     if owner_id == "":
         return AssetInfo.owner_id == ""
@@ -49,13 +55,14 @@ def apply_tag_filters(
     exclude_tags = normalize_tags(exclude_tags)
 
     if include_tags:
-        for tag_name in include_tags:
-            stmt = stmt.where(
-                exists().where(
-                    (AssetInfoTag.asset_info_id == AssetInfo.id)
-                    & (AssetInfoTag.tag_name == tag_name)
-                )
+        # one uncorrelated pass over the tag index instead of a correlated EXISTS per tag
+        wanted = set(include_tags)
+        tagged = select(AssetInfoTag.asset_info_id).where(AssetInfoTag.tag_name.in_(wanted))
+        if len(wanted) > 1:
+            tagged = tagged.group_by(AssetInfoTag.asset_info_id).having(
+                sa.func.count(AssetInfoTag.tag_name) == len(wanted)
             )
+        stmt = stmt.where(AssetInfo.id.in_(tagged))
 
     if exclude_tags:
         stmt = stmt.where(
@@ -82,43 +89,102 @@ def apply_metadata_filter(
             *preds,
         )
 
-    def _exists_clause_for_value(key: str, value) -> sa.sql.ClauseElement:
-        if value is None:
-            no_row_for_key = sa.not_(
-                sa.exists().where(
-                    AssetInfoMeta.asset_info_id == AssetInfo.id,
-                    AssetInfoMeta.key == key,
-                )
-            )
-            null_row = _exists_for_pred(
-                key,
-                AssetInfoMeta.val_json.is_(None),
-                AssetInfoMeta.val_str.is_(None),
-                AssetInfoMeta.val_num.is_(None),
-                AssetInfoMeta.val_bool.is_(None),
-            )
-            return sa.or_(no_row_for_key, null_row)
-
+    def _value_pred(value) -> sa.sql.ClauseElement:
         if isinstance(value, bool):
-            return _exists_for_pred(key, AssetInfoMeta.val_bool == bool(value))
+            return AssetInfoMeta.val_bool == bool(value)
         if isinstance(value, (int, float)):
-            from decimal import Decimal
-            num = value if isinstance(value, Decimal) else Decimal(str(value))
-            return _exists_for_pred(key, AssetInfoMeta.val_num == num)
+            # bound through the Numeric type (as a float), so ints beyond SQLite's int64 range still compare
+            return AssetInfoMeta.val_num == sa.literal(value, AssetInfoMeta.val_num.type)
         if isinstance(value, str):
-            return _exists_for_pred(key, AssetInfoMeta.val_str == value)
-        return _exists_for_pred(key, AssetInfoMeta.val_json == value)
+            return AssetInfoMeta.val_str == value
+        return AssetInfoMeta.val_json == value
+
+    def _null_clause(key: str) -> sa.sql.ClauseElement:
+        # None matches both "no row for key" and an all-NULL row, so it cannot be a positive match below
+        no_row_for_key = sa.not_(
+            sa.exists().where(
+                AssetInfoMeta.asset_info_id == AssetInfo.id,
+                AssetInfoMeta.key == key,
+            )
+        )
+        null_row = _exists_for_pred(
+            key,
+            AssetInfoMeta.val_json.is_(None),
+            AssetInfoMeta.val_str.is_(None),
+            AssetInfoMeta.val_num.is_(None),
+            AssetInfoMeta.val_bool.is_(None),
+        )
+        return sa.or_(no_row_for_key, null_row)
 
+    # Keys without a None alternative are matched together by one uncorrelated pass over the projection:
+    # rows matching any (key, value) predicate, grouped per info, must cover every such key.
+    key_preds: list[sa.sql.ClauseElement] = []
     for k, v in metadata_filter.items():
-        if isinstance(v, list):
-            ors = [_exists_clause_for_value(k, elem) for elem in v]
-            if ors:
-                stmt = stmt.where(sa.or_(*ors))
+        values = v if isinstance(v, list) else [v]
+        if not values:
+            continue
+        if any(x is None for x in values):
+            ors = [_null_clause(k) if x is None else _exists_for_pred(k, _value_pred(x)) for x in values]
+            stmt = stmt.where(sa.or_(*ors))
         else:
-            stmt = stmt.where(_exists_clause_for_value(k, v))
+            key_preds.append(sa.and_(AssetInfoMeta.key == k, sa.or_(*(_value_pred(x) for x in values))))
+
+    if key_preds:
+        matching = (
+            select(AssetInfoMeta.asset_info_id)
+            .where(sa.or_(*key_preds))
+            .group_by(AssetInfoMeta.asset_info_id)
+            .having(sa.func.count(sa.distinct(AssetInfoMeta.key)) == len(key_preds))
+        )
+        stmt = stmt.where(AssetInfo.id.in_(matching))
     return stmt
 
 
+# Hot single-row lookups are built once with bind parameters; executing a prebuilt statement skips
+# per-call construction and cache-key generation.
+_SELECT_ASSET_EXISTS_BY_HASH = (
+    select(sa.literal(True)).select_from(Asset).where(Asset.hash == sa.bindparam("asset_hash")).limit(1)
+)
+_SELECT_ASSET_BY_HASH = select(Asset).where(Asset.hash == sa.bindparam("asset_hash")).limit(1)
+_SELECT_INFO_EXISTS_FOR_ASSET_ID = (
+    select(sa.literal(True)).select_from(AssetInfo).where(AssetInfo.asset_id == sa.bindparam("asset_id")).limit(1)
+)
+_SELECT_CACHE_STATES_BY_ASSET_ID = (
+    select(AssetCacheState)
+    .where(AssetCacheState.asset_id == sa.bindparam("asset_id"))
+    .order_by(AssetCacheState.id.asc())
+)
+_TOUCH_ASSET_INFO = (
+    sa.update(AssetInfo)
+    .where(AssetInfo.id == sa.bindparam("asset_info_id"))
+    .values(last_access_time=sa.bindparam("ts"))
+)
+_TOUCH_ASSET_INFO_IF_NEWER = _TOUCH_ASSET_INFO.where(
+    sa.or_(AssetInfo.last_access_time.is_(None), AssetInfo.last_access_time < sa.bindparam("ts"))
+)
+_SELECT_TAG_NAMES_BY_INFO_ID = (
+    select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == sa.bindparam("asset_info_id"))
+)
+# by-id reads with the owner bound as a parameter; same rows as visible_owner_clause(owner_id)
+_VISIBLE_TO_BOUND_OWNER = AssetInfo.owner_id.in_(("", sa.bindparam("owner_id")))
+_SELECT_INFO_ASSET_AND_TAGS = (
+    select(AssetInfo, Asset, Tag.name)
+    .join(Asset, Asset.id == AssetInfo.asset_id)
+    .join(AssetInfoTag, AssetInfoTag.asset_info_id == AssetInfo.id, isouter=True)
+    .join(Tag, Tag.name == AssetInfoTag.tag_name, isouter=True)
+    .where(AssetInfo.id == sa.bindparam("asset_info_id"), _VISIBLE_TO_BOUND_OWNER)
+    .options(noload(AssetInfo.tags))
+    .order_by(Tag.name.asc())
+)
+_SELECT_INFO_AND_ASSET = (
+    select(AssetInfo, Asset)
+    .join(Asset, Asset.id == AssetInfo.asset_id)
+    .where(AssetInfo.id == sa.bindparam("asset_info_id"), _VISIBLE_TO_BOUND_OWNER)
+    .limit(1)
+    .options(noload(AssetInfo.tags))
+)
+
+
 def asset_exists_by_hash(
     session: Session,
     *,
@@ -127,11 +193,7 @@ def asset_exists_by_hash(
     """
     Check if an asset with a given hash exists in database.
     """
-    row = (
-        session.execute(
-            select(sa.literal(True)).select_from(Asset).where(Asset.hash == asset_hash).limit(1)
-        )
-    ).first()
+    row = session.execute(_SELECT_ASSET_EXISTS_BY_HASH, {"asset_hash": asset_hash}).first()
     return row is not None
 
 
@@ -140,13 +202,7 @@ def asset_info_exists_for_asset_id(
     *,
     asset_id: str,
 ) -> bool:
-    q = (
-        select(sa.literal(True))
-        .select_from(AssetInfo)
-        .where(AssetInfo.asset_id == asset_id)
-        .limit(1)
-    )
-    return (session.execute(q)).first() is not None
+    return session.execute(_SELECT_INFO_EXISTS_FOR_ASSET_ID, {"asset_id": asset_id}).first() is not None
 
 
 def get_asset_by_hash(
@@ -154,9 +210,7 @@ def get_asset_by_hash(
     *,
     asset_hash: str,
 ) -> Asset | None:
-    return (
-        session.execute(select(Asset).where(Asset.hash == asset_hash).limit(1))
-    ).scalars().first()
+    return session.execute(_SELECT_ASSET_BY_HASH, {"asset_hash": asset_hash}).scalars().first()
 
 
 def get_asset_info_by_id(
@@ -178,20 +232,38 @@ def list_asset_infos_page(
     offset: int = 0,
     sort: str = "created_at",
     order: str = "desc",
-) -> tuple[list[AssetInfo], dict[str, list[str]], int]:
-    base = (
-        select(AssetInfo)
+    after: tuple[Any, str] | None = None,
+    include_total: bool = True,
+) -> tuple[list[AssetInfo], dict[str, list[str]], int | None]:
+    """Page of AssetInfos plus their tags and the total match count.
+
+    after: (sort value, id) of the last row already seen; rows are keyset-paginated
+    past it. Ties on the sort column are broken by id.
+    include_total: when False the COUNT query is skipped and None is returned for total.
+    """
+    page = (
+        select(AssetInfo.id)
         .join(Asset, Asset.id == AssetInfo.asset_id)
-        .options(contains_eager(AssetInfo.asset), noload(AssetInfo.tags))
         .where(visible_owner_clause(owner_id))
     )
+    matched = page
 
+    has_filters = bool(include_tags or exclude_tags or metadata_filter or name_contains)
     if name_contains:
         escaped, esc = escape_like_prefix(name_contains)
-        base = base.where(AssetInfo.name.ilike(f"%{escaped}%", escape=esc))
-
-    base = apply_tag_filters(base, include_tags, exclude_tags)
-    base = apply_metadata_filter(base, metadata_filter)
+        matched = matched.where(AssetInfo.name.ilike(f"%{escaped}%", escape=esc))
+    matched = apply_tag_filters(matched, include_tags, exclude_tags)
+    matched = apply_metadata_filter(matched, metadata_filter)
+
+    # With tag/metadata/name filters, the page is built from the matched ids and a window count rides
+    # along, so the EXISTS filters are evaluated once for both page and total. Unfiltered, the page walks
+    # the sort index directly and COUNT is a cheap index scan, which the window would only slow down.
+    windowed_total = include_total and has_filters
+    if windowed_total:
+        matched_sq = matched.add_columns(sa.func.count().over().label("total")).subquery()
+        page = page.add_columns(matched_sq.c.total).join(matched_sq, matched_sq.c.id == AssetInfo.id)
+    elif has_filters:
+        page = page.where(AssetInfo.id.in_(matched))
 
     sort = (sort or "created_at").lower()
     order = (order or "desc").lower()
@@ -203,37 +275,47 @@ def list_asset_infos_page(
         "size": Asset.size_bytes,
     }
     sort_col = sort_map.get(sort, AssetInfo.created_at)
-    sort_exp = sort_col.desc() if order == "desc" else sort_col.asc()
-
-    base = base.order_by(sort_exp).limit(limit).offset(offset)
+    if order == "desc":
+        ordering = (sort_col.desc(), AssetInfo.id.desc())
+    else:
+        ordering = (sort_col.asc(), AssetInfo.id.asc())
+    page = page.order_by(*ordering)
+    if after is not None:
+        key, after_value = sa.tuple_(sort_col, AssetInfo.id), sa.tuple_(*after)
+        page = page.where(key < after_value if order == "desc" else key > after_value)
+    page = page.limit(limit).offset(offset).subquery()
+
+    # Tags arrive with each row as a JSON array in the order they were added. They are computed on the
+    # already-limited page so rows skipped by OFFSET never evaluate the subquery.
+    tags_ordered = (
+        select(AssetInfoTag.tag_name)
+        .where(AssetInfoTag.asset_info_id == AssetInfo.id)
+        .order_by(AssetInfoTag.added_at)
+        .correlate(AssetInfo)
+        .subquery()
+    )
+    tags_json = select(sa.func.json_group_array(tags_ordered.c.tag_name)).scalar_subquery()
 
-    count_stmt = (
-        select(sa.func.count())
-        .select_from(AssetInfo)
+    stmt = (
+        select(AssetInfo, tags_json, page.c.total if windowed_total else sa.null())
+        .join(page, page.c.id == AssetInfo.id)
         .join(Asset, Asset.id == AssetInfo.asset_id)
-        .where(visible_owner_clause(owner_id))
+        .options(contains_eager(AssetInfo.asset), noload(AssetInfo.tags))
+        .order_by(*ordering)
     )
-    if name_contains:
-        escaped, esc = escape_like_prefix(name_contains)
-        count_stmt = count_stmt.where(AssetInfo.name.ilike(f"%{escaped}%", escape=esc))
-    count_stmt = apply_tag_filters(count_stmt, include_tags, exclude_tags)
-    count_stmt = apply_metadata_filter(count_stmt, metadata_filter)
-
-    total = int((session.execute(count_stmt)).scalar_one() or 0)
-
-    infos = (session.execute(base)).unique().scalars().all()
-
-    id_list: list[str] = [i.id for i in infos]
-    tag_map: dict[str, list[str]] = defaultdict(list)
-    if id_list:
-        rows = session.execute(
-            select(AssetInfoTag.asset_info_id, Tag.name)
-            .join(Tag, Tag.name == AssetInfoTag.tag_name)
-            .where(AssetInfoTag.asset_info_id.in_(id_list))
-            .order_by(AssetInfoTag.added_at)
-        )
-        for aid, tag_name in rows.all():
-            tag_map[aid].append(tag_name)
+    rows = session.execute(stmt).all()
+    infos = [row[0] for row in rows]
+
+    total: int | None = None
+    if windowed_total and rows:
+        total = int(rows[0][2])
+    elif windowed_total and not offset and after is None:
+        total = 0
+    elif include_total:
+        # unfiltered listing, or paged past the end where no row carried the window count
+        total = int(session.execute(select(sa.func.count()).select_from(matched.subquery())).scalar_one())
+
+    tag_map: dict[str, list[str]] = {row[0].id: json.loads(row[1]) for row in rows}
 
     return infos, tag_map, total
 
@@ -243,20 +325,8 @@ def fetch_asset_info_asset_and_tags(
     asset_info_id: str,
     owner_id: str = "",
 ) -> tuple[AssetInfo, Asset, list[str]] | None:
-    stmt = (
-        select(AssetInfo, Asset, Tag.name)
-        .join(Asset, Asset.id == AssetInfo.asset_id)
-        .join(AssetInfoTag, AssetInfoTag.asset_info_id == AssetInfo.id, isouter=True)
-        .join(Tag, Tag.name == AssetInfoTag.tag_name, isouter=True)
-        .where(
-            AssetInfo.id == asset_info_id,
-            visible_owner_clause(owner_id),
-        )
-        .options(noload(AssetInfo.tags))
-        .order_by(Tag.name.asc())
-    )
-
-    rows = (session.execute(stmt)).all()
+    params = {"asset_info_id": asset_info_id, "owner_id": (owner_id or "").strip()}
+    rows = session.execute(_SELECT_INFO_ASSET_AND_TAGS, params).all()
     if not rows:
         return None
 
@@ -276,18 +346,8 @@ def fetch_asset_info_and_asset(
     asset_info_id: str,
     owner_id: str = "",
 ) -> tuple[AssetInfo, Asset] | None:
-    stmt = (
-        select(AssetInfo, Asset)
-        .join(Asset, Asset.id == AssetInfo.asset_id)
-        .where(
-            AssetInfo.id == asset_info_id,
-            visible_owner_clause(owner_id),
-        )
-        .limit(1)
-        .options(noload(AssetInfo.tags))
-    )
-    row = session.execute(stmt)
-    pair = row.first()
+    params = {"asset_info_id": asset_info_id, "owner_id": (owner_id or "").strip()}
+    pair = session.execute(_SELECT_INFO_AND_ASSET, params).first()
     if not pair:
         return None
     return pair[0], pair[1]
@@ -295,13 +355,7 @@ def fetch_asset_info_and_asset(
 def list_cache_states_by_asset_id(
     session: Session, *, asset_id: str
 ) -> Sequence[AssetCacheState]:
-    return (
-        session.execute(
-            select(AssetCacheState)
-            .where(AssetCacheState.asset_id == asset_id)
-            .order_by(AssetCacheState.id.asc())
-        )
-    ).scalars().all()
+    return session.execute(_SELECT_CACHE_STATES_BY_ASSET_ID, {"asset_id": asset_id}).scalars().all()
 
 
 def touch_asset_info_by_id(
@@ -312,12 +366,8 @@ def touch_asset_info_by_id(
     only_if_newer: bool = True,
 ) -> None:
     ts = ts or utcnow()
-    stmt = sa.update(AssetInfo).where(AssetInfo.id == asset_info_id)
-    if only_if_newer:
-        stmt = stmt.where(
-            sa.or_(AssetInfo.last_access_time.is_(None), AssetInfo.last_access_time < ts)
-        )
-    session.execute(stmt.values(last_access_time=ts))
+    stmt = _TOUCH_ASSET_INFO_IF_NEWER if only_if_newer else _TOUCH_ASSET_INFO
+    session.execute(stmt, {"asset_info_id": asset_info_id, "ts": ts})
 
 
 def create_asset_info_for_existing_asset(
@@ -329,27 +379,30 @@ def create_asset_info_for_existing_asset(
     tags: Sequence[str] | None = None,
     tag_origin: str = "manual",
     owner_id: str = "",
+    now: datetime | None = None,
 ) -> AssetInfo:
     """Create or return an existing AssetInfo for an Asset identified by asset_hash."""
-    now = utcnow()
+    now = now or utcnow()
     asset = get_asset_by_hash(session, asset_hash=asset_hash)
     if not asset:
         raise ValueError(f"Unknown asset hash {asset_hash}")
 
-    info = AssetInfo(
-        owner_id=owner_id,
-        name=name,
-        asset_id=asset.id,
-        preview_id=None,
-        created_at=now,
-        updated_at=now,
-        last_access_time=now,
-    )
-    try:
-        with session.begin_nested():
-            session.add(info)
-            session.flush()
-    except IntegrityError:
+    # RETURNING yields the row only when it was inserted, replacing the savepoint + flush probe
+    info = session.execute(
+        sqlite.insert(AssetInfo)
+        .values(
+            owner_id=owner_id,
+            name=name,
+            asset_id=asset.id,
+            preview_id=None,
+            created_at=now,
+            updated_at=now,
+            last_access_time=now,
+        )
+        .on_conflict_do_nothing(index_elements=[AssetInfo.asset_id, AssetInfo.owner_id, AssetInfo.name])
+        .returning(AssetInfo)
+    ).scalar_one_or_none()
+    if info is None:
         existing = (
             session.execute(
                 select(AssetInfo)
@@ -361,7 +414,7 @@ def create_asset_info_for_existing_asset(
                 )
                 .limit(1)
             )
-        ).unique().scalars().first()
+        ).scalars().first()
         if not existing:
             raise RuntimeError("AssetInfo upsert failed to find existing row after conflict.")
         return existing
@@ -382,6 +435,7 @@ def create_asset_info_for_existing_asset(
             session,
             asset_info_id=info.id,
             user_metadata=new_meta,
+            now=now,
         )
 
     if tags is not None:
@@ -390,6 +444,7 @@ def create_asset_info_for_existing_asset(
             asset_info_id=info.id,
             tags=tags,
             origin=tag_origin,
+            now=now,
         )
     return info
 
@@ -400,73 +455,124 @@ def set_asset_info_tags(
     asset_info_id: str,
     tags: Sequence[str],
     origin: str = "manual",
+    now: datetime | None = None,
 ) -> dict:
     desired = normalize_tags(tags)
 
-    current = set(
-        tag_name for (tag_name,) in (
-            session.execute(select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == asset_info_id))
-        ).all()
-    )
+    current = set(session.execute(_SELECT_TAG_NAMES_BY_INFO_ID, {"asset_info_id": asset_info_id}).scalars())
 
     to_add = [t for t in desired if t not in current]
-    to_remove = [t for t in current if t not in desired]
+    keep = set(desired)
+    to_remove = [t for t in current if t not in keep]
 
     if to_add:
         ensure_tags_exist(session, to_add, tag_type="user")
-        session.add_all([
-            AssetInfoTag(asset_info_id=asset_info_id, tag_name=t, origin=origin, added_at=utcnow())
-            for t in to_add
-        ])
-        session.flush()
+        now = now or utcnow()
+        session.execute(
+            sqlite.insert(AssetInfoTag),
+            [{"asset_info_id": asset_info_id, "tag_name": t, "origin": origin, "added_at": now} for t in to_add],
+        )
 
     if to_remove:
         session.execute(
             delete(AssetInfoTag)
             .where(AssetInfoTag.asset_info_id == asset_info_id, AssetInfoTag.tag_name.in_(to_remove))
         )
-        session.flush()
 
     return {"added": to_add, "removed": to_remove, "total": desired}
 
 
+_META_VALUE_COLUMNS = ("val_str", "val_num", "val_bool", "val_json")
+
+
+def _same_meta_value(column: str, new, stored) -> bool:
+    """Type-exact equality for the projection diff; plain == would treat 1 and True (or [1] and [true]) as equal."""
+    if column == "val_json":
+        return json.dumps(new, sort_keys=True) == json.dumps(stored, sort_keys=True)
+    if column == "val_num":
+        # stored numbers come back as float, so an int and its float value are the same projection
+        return new == stored
+    return type(new) is type(stored) and new == stored
+
+
 def replace_asset_info_metadata_projection(
     session: Session,
     *,
     asset_info_id: str,
     user_metadata: dict | None = None,
+    now: datetime | None = None,
 ) -> None:
-    info = session.get(AssetInfo, asset_info_id)
-    if not info:
+    # A single UPDATE both checks existence and writes the two columns; the info row is never loaded.
+    updated = session.execute(
+        sa.update(AssetInfo)
+        .where(AssetInfo.id == asset_info_id)
+        .values(user_metadata=user_metadata or {}, updated_at=now or utcnow())
+        .returning(AssetInfo.id),
+        execution_options={"synchronize_session": False},
+    ).first()
+    if updated is None:
         raise ValueError(f"AssetInfo {asset_info_id} not found")
-
-    info.user_metadata = user_metadata or {}
-    info.updated_at = utcnow()
-    session.flush()
-
-    session.execute(delete(AssetInfoMeta).where(AssetInfoMeta.asset_info_id == asset_info_id))
-    session.flush()
-
-    if not user_metadata:
-        return
-
-    rows: list[AssetInfoMeta] = []
-    for k, v in user_metadata.items():
-        for r in project_kv(k, v):
-            rows.append(
-                AssetInfoMeta(
-                    asset_info_id=asset_info_id,
-                    key=r["key"],
-                    ordinal=int(r["ordinal"]),
-                    val_str=r.get("val_str"),
-                    val_num=r.get("val_num"),
-                    val_bool=r.get("val_bool"),
-                    val_json=r.get("val_json"),
-                )
+    # Callers that already hold the instance (just created, or being updated) see the new values on next access.
+    held = session.identity_map.get(session.identity_key(AssetInfo, asset_info_id))
+    if held is not None:
+        session.expire(held, ["user_metadata", "updated_at"])
+
+    # Plain dicts with every column present go out as one Core executemany instead of per-row ORM INSERTs.
+    rows: dict[tuple[str, int], dict] = {}
+    for k, v in (user_metadata or {}).items():
+        projected = project_kv(k, v)
+        # A key whose values are all NULL matches the same filters as an absent key; don't store it.
+        if all(r.get(c) is None for r in projected for c in _META_VALUE_COLUMNS):
+            continue
+        for r in projected:
+            ordinal = int(r["ordinal"])
+            rows[(r["key"], ordinal)] = {
+                "asset_info_id": asset_info_id,
+                "key": r["key"],
+                "ordinal": ordinal,
+                "val_str": r.get("val_str"),
+                "val_num": r.get("val_num"),
+                "val_bool": r.get("val_bool"),
+                "val_json": r.get("val_json"),
+            }
+
+    # Diff against the stored projection so only changed rows (and their key/value indexes) are written.
+    # val_num is read back as the stored float, matching the int/float values project_kv passes through.
+    existing = session.execute(
+        select(
+            AssetInfoMeta.key,
+            AssetInfoMeta.ordinal,
+            AssetInfoMeta.val_str,
+            sa.type_coerce(AssetInfoMeta.val_num, sa.Float),
+            AssetInfoMeta.val_bool,
+            AssetInfoMeta.val_json,
+        )
+        .where(AssetInfoMeta.asset_info_id == asset_info_id)
+    ).all()
+    stale: list[tuple[str, int]] = []
+    for key, ordinal, *values in existing:
+        new_row = rows.get((key, ordinal))
+        if new_row is None:
+            stale.append((key, ordinal))
+        elif all(_same_meta_value(c, new_row[c], v) for c, v in zip(_META_VALUE_COLUMNS, values)):
+            del rows[(key, ordinal)]
+
+    for chunk in iter_chunks(stale, MAX_BIND_PARAMS // 2):
+        session.execute(
+            delete(AssetInfoMeta).where(
+                AssetInfoMeta.asset_info_id == asset_info_id,
+                sa.tuple_(AssetInfoMeta.key, AssetInfoMeta.ordinal).in_(chunk),
             )
+        )
     if rows:
-        session.add_all(rows)
-        session.flush()
+        ins = sqlite.insert(AssetInfoMeta)
+        session.execute(
+            ins.on_conflict_do_update(
+                index_elements=[AssetInfoMeta.asset_info_id, AssetInfoMeta.key, AssetInfoMeta.ordinal],
+                set_={c: getattr(ins.excluded, c) for c in _META_VALUE_COLUMNS},
+            ),
+            list(rows.values()),
+        )
 
 
 def ingest_fs_asset(
@@ -484,6 +590,7 @@ def ingest_fs_asset(
     tags: Sequence[str] = (),
     tag_origin: str = "manual",
     require_existing_tags: bool = False,
+    now: datetime | None = None,
 ) -> dict:
     """
     Idempotently upsert:
@@ -493,7 +600,7 @@ def ingest_fs_asset(
     Returns flags and ids.
     """
     locator = os.path.abspath(abs_path)
-    now = utcnow()
+    now = now or utcnow()
 
     if preview_id:
         if not session.get(Asset, preview_id):
@@ -508,9 +615,7 @@ def ingest_fs_asset(
     }
 
     # 1) Asset by hash
-    asset = (
-        session.execute(select(Asset).where(Asset.hash == asset_hash).limit(1))
-    ).scalars().first()
+    asset = get_asset_by_hash(session, asset_hash=asset_hash)
     if not asset:
         vals = {
             "hash": asset_hash,
@@ -518,18 +623,17 @@ def ingest_fs_asset(
             "mime_type": mime_type,
             "created_at": now,
         }
-        res = session.execute(
+        # RETURNING hands back the new row; only losing a race to another writer needs a re-select
+        asset = session.execute(
             sqlite.insert(Asset)
             .values(**vals)
-            .on_conflict_do_nothing(index_elements=[Asset.hash])
-        )
-        if int(res.rowcount or 0) > 0:
+            .on_conflict_do_nothing(index_elements=[Asset.hash], index_where=Asset.hash.isnot(None))
+            .returning(Asset)
+        ).scalar_one_or_none()
+        if asset:
             out["asset_created"] = True
-        asset = (
-            session.execute(
-                select(Asset).where(Asset.hash == asset_hash).limit(1)
-            )
-        ).scalars().first()
+        else:
+            asset = get_asset_by_hash(session, asset_hash=asset_hash)
         if not asset:
             raise RuntimeError("Asset row not found after upsert.")
     else:
@@ -543,114 +647,79 @@ def ingest_fs_asset(
         if changed:
             out["asset_updated"] = True
 
-    # 2) AssetCacheState upsert by file_path (unique)
-    vals = {
-        "asset_id": asset.id,
-        "file_path": locator,
-        "mtime_ns": int(mtime_ns),
-    }
-    ins = (
-        sqlite.insert(AssetCacheState)
-        .values(**vals)
-        .on_conflict_do_nothing(index_elements=[AssetCacheState.file_path])
-    )
-
-    res = session.execute(ins)
-    if int(res.rowcount or 0) > 0:
-        out["state_created"] = True
-    else:
-        upd = (
-            sa.update(AssetCacheState)
-            .where(AssetCacheState.file_path == locator)
-            .where(
-                sa.or_(
-                    AssetCacheState.asset_id != asset.id,
-                    AssetCacheState.mtime_ns.is_(None),
-                    AssetCacheState.mtime_ns != int(mtime_ns),
-                )
-            )
-            .values(asset_id=asset.id, mtime_ns=int(mtime_ns))
+    # 2) AssetCacheState upsert by file_path (unique). The read tells an insert from an update and
+    #    skips the write entirely for an unchanged row; the upsert's WHERE covers a concurrent writer.
+    existing_state = session.execute(
+        select(AssetCacheState.asset_id, AssetCacheState.mtime_ns).where(AssetCacheState.file_path == locator)
+    ).first()
+    if existing_state is None or tuple(existing_state) != (asset.id, int(mtime_ns)):
+        ins = sqlite.insert(AssetCacheState).values(
+            asset_id=asset.id,
+            file_path=locator,
+            mtime_ns=int(mtime_ns),
         )
-        res2 = session.execute(upd)
-        if int(res2.rowcount or 0) > 0:
-            out["state_updated"] = True
+        upsert = ins.on_conflict_do_update(
+            index_elements=[AssetCacheState.file_path],
+            set_={"asset_id": ins.excluded.asset_id, "mtime_ns": ins.excluded.mtime_ns},
+            where=sa.or_(
+                AssetCacheState.asset_id != ins.excluded.asset_id,
+                AssetCacheState.mtime_ns.is_(None),
+                AssetCacheState.mtime_ns != ins.excluded.mtime_ns,
+            ),
+        )
+        res = session.execute(upsert)
+        if int(res.rowcount or 0) > 0:
+            out["state_created" if existing_state is None else "state_updated"] = True
 
     # 3) Optional AssetInfo + tags + metadata
     if info_name:
-        try:
-            with session.begin_nested():
-                info = AssetInfo(
-                    owner_id=owner_id,
-                    name=info_name,
-                    asset_id=asset.id,
-                    preview_id=preview_id,
-                    created_at=now,
-                    updated_at=now,
-                    last_access_time=now,
-                )
-                session.add(info)
-                session.flush()
-                out["asset_info_id"] = info.id
-        except IntegrityError:
-            pass
-
-        existing_info = (
-            session.execute(
-                select(AssetInfo)
-                .where(
-                    AssetInfo.asset_id == asset.id,
-                    AssetInfo.name == info_name,
-                    (AssetInfo.owner_id == owner_id),
-                )
-                .limit(1)
-            )
-        ).unique().scalar_one_or_none()
+        # Get-or-create in one statement: a new row is inserted, an existing one is touched, and either
+        # way RETURNING hands back the row without a savepoint or a follow-up SELECT.
+        ins = sqlite.insert(AssetInfo).values(
+            owner_id=owner_id,
+            name=info_name,
+            asset_id=asset.id,
+            preview_id=preview_id,
+            created_at=now,
+            updated_at=now,
+            last_access_time=now,
+        )
+        upsert = ins.on_conflict_do_update(
+            index_elements=[AssetInfo.asset_id, AssetInfo.owner_id, AssetInfo.name],
+            set_={
+                "preview_id": sa.func.coalesce(ins.excluded.preview_id, AssetInfo.preview_id),
+                "updated_at": ins.excluded.updated_at,
+                "last_access_time": sa.func.max(AssetInfo.last_access_time, ins.excluded.last_access_time),
+            },
+        )
+        existing_info = session.execute(
+            upsert.returning(AssetInfo),
+            execution_options={"populate_existing": True},
+        ).scalar_one_or_none()
         if not existing_info:
             raise RuntimeError("Failed to update or insert AssetInfo.")
-
-        if preview_id and existing_info.preview_id != preview_id:
-            existing_info.preview_id = preview_id
-
-        existing_info.updated_at = now
-        if existing_info.last_access_time < now:
-            existing_info.last_access_time = now
-        session.flush()
         out["asset_info_id"] = existing_info.id
 
         norm = [t.strip().lower() for t in (tags or []) if (t or "").strip()]
         if norm and out["asset_info_id"] is not None:
-            if not require_existing_tags:
+            if require_existing_tags:
+                existing_tag_names = set(session.execute(select(Tag.name).where(Tag.name.in_(norm))).scalars())
+                missing = [t for t in norm if t not in existing_tag_names]
+                if missing:
+                    raise ValueError(f"Unknown tags: {missing}")
+            else:
                 ensure_tags_exist(session, norm, tag_type="user")
 
-            existing_tag_names = set(
-                name for (name,) in (session.execute(select(Tag.name).where(Tag.name.in_(norm)))).all()
-            )
-            missing = [t for t in norm if t not in existing_tag_names]
-            if missing and require_existing_tags:
-                raise ValueError(f"Unknown tags: {missing}")
-
-            existing_links = set(
-                tag_name
-                for (tag_name,) in (
-                    session.execute(
-                        select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == out["asset_info_id"])
-                    )
-                ).all()
-            )
-            to_add = [t for t in norm if t in existing_tag_names and t not in existing_links]
-            if to_add:
-                session.add_all(
-                    [
-                        AssetInfoTag(
-                            asset_info_id=out["asset_info_id"],
-                            tag_name=t,
-                            origin=tag_origin,
-                            added_at=now,
-                        )
-                        for t in to_add
-                    ]
+            # link every existing tag not yet linked, in one Core INSERT..SELECT
+            session.execute(
+                sqlite.insert(AssetInfoTag)
+                .from_select(
+                    ["asset_info_id", "tag_name", "origin", "added_at"],
+                    select(sa.literal(out["asset_info_id"]), Tag.name, sa.literal(tag_origin), sa.literal(now))
+                    .where(Tag.name.in_(norm)),
                 )
-                session.flush()
+                .on_conflict_do_nothing(index_elements=[AssetInfoTag.asset_info_id, AssetInfoTag.tag_name])
+            )
 
         # metadata["filename"] hack
         if out["asset_info_id"] is not None:
@@ -670,6 +739,7 @@ def ingest_fs_asset(
                     session,
                     asset_info_id=out["asset_info_id"],
                     user_metadata=new_meta,
+                    now=now,
                 )
 
     try:
@@ -688,7 +758,9 @@ def update_asset_info_full(
     user_metadata: dict | None = None,
     tag_origin: str = "manual",
     asset_info_row: Any = None,
+    now: datetime | None = None,
 ) -> AssetInfo:
+    now = now or utcnow()
     if not asset_info_row:
         info = session.get(AssetInfo, asset_info_id)
         if not info:
@@ -714,7 +786,7 @@ def update_asset_info_full(
         if computed_filename:
             new_meta["filename"] = computed_filename
         replace_asset_info_metadata_projection(
-            session, asset_info_id=asset_info_id, user_metadata=new_meta
+            session, asset_info_id=asset_info_id, user_metadata=new_meta, now=now
         )
         touched = True
     else:
@@ -724,7 +796,7 @@ def update_asset_info_full(
                 new_meta = dict(current_meta)
                 new_meta["filename"] = computed_filename
                 replace_asset_info_metadata_projection(
-                    session, asset_info_id=asset_info_id, user_metadata=new_meta
+                    session, asset_info_id=asset_info_id, user_metadata=new_meta, now=now
                 )
                 touched = True
 
@@ -734,11 +806,12 @@ def update_asset_info_full(
             asset_info_id=asset_info_id,
             tags=tags,
             origin=tag_origin,
+            now=now,
         )
         touched = True
 
     if touched and user_metadata is None:
-        info.updated_at = utcnow()
+        info.updated_at = now
         session.flush()
 
     return info
@@ -778,12 +851,9 @@ def list_tags_with_usage(
         .subquery()
     )
 
+    cnt = func.coalesce(counts_sq.c.cnt, 0)
     q = (
-        select(
-            Tag.name,
-            Tag.tag_type,
-            func.coalesce(counts_sq.c.cnt, 0).label("count"),
-        )
+        select(Tag.name, Tag.tag_type, cnt.label("count"))
         .select_from(Tag)
         .join(counts_sq, counts_sq.c.tag_name == Tag.name, isouter=True)
     )
@@ -793,50 +863,26 @@ def list_tags_with_usage(
         q = q.where(Tag.name.like(escaped + "%", escape=esc))
 
     if not include_zero:
-        q = q.where(func.coalesce(counts_sq.c.cnt, 0) > 0)
+        q = q.where(cnt > 0)
 
     if order == "name_asc":
         q = q.order_by(Tag.name.asc())
     else:
-        q = q.order_by(func.coalesce(counts_sq.c.cnt, 0).desc(), Tag.name.asc())
+        q = q.order_by(cnt.desc(), Tag.name.asc())
 
-    total_q = select(func.count()).select_from(Tag)
-    if prefix:
-        escaped, esc = escape_like_prefix(prefix.strip().lower())
-        total_q = total_q.where(Tag.name.like(escaped + "%", escape=esc))
-    if not include_zero:
-        total_q = total_q.where(
-            Tag.name.in_(select(AssetInfoTag.tag_name).group_by(AssetInfoTag.tag_name))
-        )
-
-    rows = (session.execute(q.limit(limit).offset(offset))).all()
-    total = (session.execute(total_q)).scalar_one()
+    # the total rides along on every row; only a page past the end needs its own COUNT
+    rows = session.execute(q.add_columns(func.count().over().label("total")).limit(limit).offset(offset)).all()
+    if rows:
+        total = rows[0].total
+    else:
+        total = session.execute(select(func.count()).select_from(q.order_by(None).subquery())).scalar_one()
 
-    rows_norm = [(name, ttype, int(count or 0)) for (name, ttype, count) in rows]
+    rows_norm = [(name, ttype, int(count or 0)) for (name, ttype, count, _total) in rows]
     return rows_norm, int(total or 0)
 
 
-def ensure_tags_exist(session: Session, names: Iterable[str], tag_type: str = "user") -> None:
-    wanted = normalize_tags(list(names))
-    if not wanted:
-        return
-    rows = [{"name": n, "tag_type": tag_type} for n in list(dict.fromkeys(wanted))]
-    ins = (
-        sqlite.insert(Tag)
-        .values(rows)
-        .on_conflict_do_nothing(index_elements=[Tag.name])
-    )
-    session.execute(ins)
-
-
 def get_asset_tags(session: Session, *, asset_info_id: str) -> list[str]:
-    return [
-        tag_name for (tag_name,) in (
-            session.execute(
-                select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == asset_info_id)
-            )
-        ).all()
-    ]
+    return session.execute(_SELECT_TAG_NAMES_BY_INFO_ID, {"asset_info_id": asset_info_id}).scalars().all()
 
 
 def add_tags_to_asset_info(
@@ -847,6 +893,7 @@ def add_tags_to_asset_info(
     origin: str = "manual",
     create_if_missing: bool = True,
     asset_info_row: Any = None,
+    now: datetime | None = None,
 ) -> dict:
     if not asset_info_row:
         info = session.get(AssetInfo, asset_info_id)
@@ -861,41 +908,30 @@ def add_tags_to_asset_info(
     if create_if_missing:
         ensure_tags_exist(session, norm, tag_type="user")
 
-    current = {
-        tag_name
-        for (tag_name,) in (
-            session.execute(
-                sa.select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == asset_info_id)
-            )
-        ).all()
-    }
+    current = set(session.execute(_SELECT_TAG_NAMES_BY_INFO_ID, {"asset_info_id": asset_info_id}).scalars())
 
-    want = set(norm)
-    to_add = sorted(want - current)
+    to_add = [t for t in norm if t not in current]
 
+    added: list[str] = []
     if to_add:
-        with session.begin_nested() as nested:
-            try:
-                session.add_all(
-                    [
-                        AssetInfoTag(
-                            asset_info_id=asset_info_id,
-                            tag_name=t,
-                            origin=origin,
-                            added_at=utcnow(),
-                        )
-                        for t in to_add
-                    ]
-                )
-                session.flush()
-            except IntegrityError:
-                nested.rollback()
+        now = now or utcnow()
+        # INSERT..SELECT through Tag skips names that don't exist; RETURNING reports what actually landed
+        ins = (
+            sqlite.insert(AssetInfoTag)
+            .from_select(
+                ["asset_info_id", "tag_name", "origin", "added_at"],
+                select(sa.literal(asset_info_id), Tag.name, sa.literal(origin), sa.literal(now))
+                .where(Tag.name.in_(to_add)),
+            )
+            .on_conflict_do_nothing(index_elements=[AssetInfoTag.asset_info_id, AssetInfoTag.tag_name])
+            .returning(AssetInfoTag.tag_name)
+        )
+        added = session.execute(ins).scalars().all()
 
-    after = set(get_asset_tags(session, asset_info_id=asset_info_id))
     return {
-        "added": sorted(((after - current) & want)),
-        "already_present": sorted(want & current),
-        "total_tags": sorted(after),
+        "added": sorted(added),
+        "already_present": sorted(t for t in norm if t in current),
+        "total_tags": sorted(current.union(added)),
     }
 
 
@@ -914,30 +950,19 @@ def remove_tags_from_asset_info(
         total = get_asset_tags(session, asset_info_id=asset_info_id)
         return {"removed": [], "not_present": [], "total_tags": total}
 
-    existing = {
-        tag_name
-        for (tag_name,) in (
-            session.execute(
-                sa.select(AssetInfoTag.tag_name).where(AssetInfoTag.asset_info_id == asset_info_id)
-            )
-        ).all()
-    }
-
-    to_remove = sorted(set(t for t in norm if t in existing))
-    not_present = sorted(set(t for t in norm if t not in existing))
-
-    if to_remove:
+    removed = set(
         session.execute(
             delete(AssetInfoTag)
             .where(
                 AssetInfoTag.asset_info_id == asset_info_id,
-                AssetInfoTag.tag_name.in_(to_remove),
+                AssetInfoTag.tag_name.in_(norm),
             )
-        )
-        session.flush()
+            .returning(AssetInfoTag.tag_name)
+        ).scalars().all()
+    )
 
     total = get_asset_tags(session, asset_info_id=asset_info_id)
-    return {"removed": to_remove, "not_present": not_present, "total_tags": total}
+    return {"removed": sorted(removed), "not_present": sorted(t for t in norm if t not in removed), "total_tags": total}
 
 
 def remove_missing_tag_for_asset_id(
@@ -958,19 +983,23 @@ def set_asset_info_preview(
     *,
     asset_info_id: str,
     preview_asset_id: str | None = None,
+    now: datetime | None = None,
 ) -> None:
     """Set or clear preview_id and bump updated_at. Raises on unknown IDs."""
-    info = session.get(AssetInfo, asset_info_id)
-    if not info:
+    # the info row and the preview asset's existence come back in one round-trip
+    preview_ok = (
+        sa.literal(True) if preview_asset_id is None else exists().where(Asset.id == preview_asset_id)
+    )
+    row = session.execute(
+        select(AssetInfo, preview_ok.label("preview_ok")).where(AssetInfo.id == asset_info_id)
+    ).first()
+    if not row:
         raise ValueError(f"AssetInfo {asset_info_id} not found")
+    info, found = row
+    if not found:
+        raise ValueError(f"Preview Asset {preview_asset_id} not found")
 
-    if preview_asset_id is None:
-        info.preview_id = None
-    else:
-        # validate preview asset exists
-        if not session.get(Asset, preview_asset_id):
-            raise ValueError(f"Preview Asset {preview_asset_id} not found")
-        info.preview_id = preview_asset_id
+    info.preview_id = preview_asset_id
 
-    info.updated_at = utcnow()
+    info.updated_at = now or utcnow()
     session.flush()
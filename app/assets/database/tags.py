@@ -1,62 +1,99 @@
-from typing import Iterable
+import weakref
+from typing import Iterable, Sequence
 
 import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects import sqlite
 
 from app.assets.helpers import normalize_tags, utcnow
 from app.assets.database.models import Tag, AssetInfoTag, AssetInfo
+from app.assets.database.bulk_ops import MAX_BIND_PARAMS, iter_chunks
+
+
+# Tag names known to be committed, per engine. Nothing deletes tags, so entries never go stale;
+# names join the set only once the transaction that inserted them commits.
+_KNOWN_TAGS: "weakref.WeakKeyDictionary[Engine, set[str]]" = weakref.WeakKeyDictionary()
+_PENDING_TAGS_KEY = "assets_pending_known_tags"
+
+
+@event.listens_for(Session, "after_commit")
+def _promote_pending_tags(session: Session) -> None:
+    pending = session.info.pop(_PENDING_TAGS_KEY, None)
+    if pending:
+        bind, names = pending
+        _KNOWN_TAGS.setdefault(bind, set()).update(names)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending_tags(session: Session, _previous_transaction) -> None:
+    session.info.pop(_PENDING_TAGS_KEY, None)
 
 
 def ensure_tags_exist(session: Session, names: Iterable[str], tag_type: str = "user") -> None:
-    wanted = normalize_tags(list(names))
+    bind = session.get_bind()
+    known = _KNOWN_TAGS.get(bind, ())
+    wanted = [n for n in normalize_tags(list(names)) if n not in known]
     if not wanted:
-        return
-    rows = [{"name": n, "tag_type": tag_type} for n in list(dict.fromkeys(wanted))]
+        return  # skip the INSERT, and with it the write lock, when every tag is already known
     ins = (
-            sqlite.insert(Tag)
-            .values(rows)
-            .on_conflict_do_nothing(index_elements=[Tag.name])
-        )
-    return session.execute(ins)
+        sqlite.insert(Tag)
+        .values([{"name": n, "tag_type": tag_type} for n in wanted])
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+    )
+    session.execute(ins)
+    session.info.setdefault(_PENDING_TAGS_KEY, (bind, set()))[1].update(wanted)
 
-def add_missing_tag_for_asset_id(
+
+def add_missing_tag_for_asset_ids(
     session: Session,
     *,
-    asset_id: str,
+    asset_ids: Sequence[str],
     origin: str = "automatic",
 ) -> None:
+    """Tag every AssetInfo of the given assets as 'missing' with one INSERT..SELECT per chunk of ids."""
+    if not asset_ids:
+        return
     select_rows = (
         sqlalchemy.select(
             AssetInfo.id.label("asset_info_id"),
             sqlalchemy.literal("missing").label("tag_name"),
-            sqlalchemy.literal(origin).label("origin"),
-            sqlalchemy.literal(utcnow()).label("added_at"),
+            sqlalchemy.bindparam("origin").label("origin"),
+            sqlalchemy.bindparam("now", type_=AssetInfoTag.added_at.type).label("added_at"),
         )
-        .where(AssetInfo.asset_id == asset_id)
+        .where(AssetInfo.asset_id.in_(sqlalchemy.bindparam("ids", expanding=True)))
         .where(
             sqlalchemy.not_(
                 sqlalchemy.exists().where((AssetInfoTag.asset_info_id == AssetInfo.id) & (AssetInfoTag.tag_name == "missing"))
             )
         )
     )
-    session.execute(
-        sqlite.insert(AssetInfoTag)
+    ins = (
+        sqlite.insert(AssetInfoTag.__table__)  # Core table: an ORM insert would treat the params as rows
         .from_select(
             ["asset_info_id", "tag_name", "origin", "added_at"],
             select_rows,
         )
         .on_conflict_do_nothing(index_elements=[AssetInfoTag.asset_info_id, AssetInfoTag.tag_name])
     )
+    # one statement for every chunk: only the bound values change, so it compiles once
+    now = utcnow()
+    for chunk in iter_chunks(list(asset_ids), MAX_BIND_PARAMS):
+        session.execute(ins, {"ids": chunk, "origin": origin, "now": now})
 
-def remove_missing_tag_for_asset_id(
+def remove_missing_tag_for_asset_ids(
     session: Session,
     *,
-    asset_id: str,
+    asset_ids: Sequence[str],
 ) -> None:
-    session.execute(
-        sqlalchemy.delete(AssetInfoTag).where(
-            AssetInfoTag.asset_info_id.in_(sqlalchemy.select(AssetInfo.id).where(AssetInfo.asset_id == asset_id)),
-            AssetInfoTag.tag_name == "missing",
-        )
+    if not asset_ids:
+        return
+    stmt = sqlalchemy.delete(AssetInfoTag).where(
+        AssetInfoTag.asset_info_id.in_(
+            sqlalchemy.select(AssetInfo.id).where(AssetInfo.asset_id.in_(sqlalchemy.bindparam("ids", expanding=True)))
+        ),
+        AssetInfoTag.tag_name == "missing",
     )
+    for chunk in iter_chunks(list(asset_ids), MAX_BIND_PARAMS):
+        session.execute(stmt, {"ids": chunk})
@@ -5,6 +5,8 @@ import asyncio
 
 
 DEFAULT_CHUNK = 8 * 1024 *1024 # 8MB
+# files at least this large are hashed from a memory map on all cores instead of streamed
+MMAP_THRESHOLD = 16 * 1024 * 1024
 
 # NOTE: this allows hashing different representations of a file-like object
 def blake3_hash(
@@ -23,8 +25,7 @@ def blake3_hash(
     if hasattr(fp, "read"):
         return _hash_file_obj(fp, chunk_size)
 
-    with open(os.fspath(fp), "rb") as f:
-        return _hash_file_obj(f, chunk_size)
+    return _hash_path(os.fspath(fp), chunk_size)
 
 
 async def blake3_hash_async(
@@ -38,11 +39,19 @@ async def blake3_hash_async(
     if hasattr(fp, "read"):
         return await asyncio.to_thread(blake3_hash, fp, chunk_size)
 
-    def _worker() -> str:
-        with open(os.fspath(fp), "rb") as f:
-            return _hash_file_obj(f, chunk_size)
+    return await asyncio.to_thread(_hash_path, os.fspath(fp), chunk_size)
+
+
+def _hash_path(path: str, chunk_size: int = DEFAULT_CHUNK) -> str:
+    """
+    Hash a file by name. Large files are memory-mapped and hashed by blake3's
+    multithreaded tree mode, which skips the copy into read buffers.
+    """
+    if hasattr(blake3, "update_mmap") and os.path.getsize(path) >= MMAP_THRESHOLD:
+        return blake3(max_threads=blake3.AUTO).update_mmap(path).hexdigest()
 
-    return await asyncio.to_thread(_worker)
+    with open(path, "rb") as f:
+        return _hash_file_obj(f, chunk_size)
 
 
 def _hash_file_obj(file_obj: IO, chunk_size: int = DEFAULT_CHUNK) -> str:
@@ -1,5 +1,8 @@
-import contextlib
+import bisect
+import functools
 import os
+import time
+import uuid
 from decimal import Decimal
 from aiohttp import web
 from datetime import datetime, timezone
@@ -12,18 +15,35 @@ import folder_paths
 RootType = Literal["models", "input", "output"]
 ALLOWED_ROOTS: tuple[RootType, ...] = ("models", "input", "output")
 
+_DELETE_LOWER_HEX = str.maketrans("", "", "0123456789abcdef")
+
+
+def is_lower_hex(s: str) -> bool:
+    """True if every character of s is a lowercase hex digit (vacuously true for '')."""
+    return not s.translate(_DELETE_LOWER_HEX)
+
+
 def get_query_dict(request: web.Request) -> dict[str, Any]:
     """
     Gets a dictionary of query parameters from the request.
 
     'request.query' is a MultiMapping[str], needs to be converted to a dictionary to be validated by Pydantic.
     """
-    query_dict = {
-        key: request.query.getall(key) if len(request.query.getall(key)) > 1 else request.query.get(key)
-        for key in request.query.keys()
-    }
+    query_dict: dict[str, Any] = {}
+    for key, value in request.query.items():
+        if key not in query_dict:
+            query_dict[key] = value
+        elif isinstance(query_dict[key], list):
+            query_dict[key].append(value)
+        else:
+            query_dict[key] = [query_dict[key], value]
     return query_dict
 
+@functools.lru_cache(maxsize=4096)
+def _abspath(p: str) -> str:
+    """os.path.abspath for configured base directories, which get re-resolved for every scanned file."""
+    return os.path.abspath(p)
+
 def list_tree(base_dir: str) -> list[str]:
     out: list[str] = []
     base_abs = os.path.abspath(base_dir)
@@ -39,11 +59,11 @@ def prefixes_for_root(root: RootType) -> list[str]:
         bases: list[str] = []
         for _bucket, paths in get_comfy_models_folders():
             bases.extend(paths)
-        return [os.path.abspath(p) for p in bases]
+        return [_abspath(p) for p in bases]
     if root == "input":
-        return [os.path.abspath(folder_paths.get_input_directory())]
+        return [_abspath(folder_paths.get_input_directory())]
     if root == "output":
-        return [os.path.abspath(folder_paths.get_output_directory())]
+        return [_abspath(folder_paths.get_output_directory())]
     return []
 
 def escape_like_prefix(s: str, escape: str = "!") -> tuple[str, str]:
@@ -54,6 +74,12 @@ def escape_like_prefix(s: str, escape: str = "!") -> tuple[str, str]:
     s = s.replace("%", escape + "%").replace("_", escape + "_")  # escape LIKE wildcards
     return s, escape
 
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Half-open [lo, hi) bounds covering every string that starts with a non-empty prefix.
+    Unlike LIKE, the comparison is index-friendly and needs no escaping.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 def fast_asset_file_check(
     *,
     mtime_db: int | None,
@@ -74,6 +100,16 @@ def utcnow() -> datetime:
     """Naive UTC timestamp (no tzinfo). We always treat DB datetimes as UTC."""
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
+def uuid7() -> str:
+    """
+    Time-ordered UUIDv7 string (RFC 9562): 48-bit Unix milliseconds followed by random bits.
+    New primary keys land at the right edge of the id B-trees instead of scattering across them.
+    """
+    value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
 def get_comfy_models_folders() -> list[tuple[str, list[str]]]:
     """Build a list of (folder_name, base_paths[]) categories that are configured for model locations.
 
@@ -81,10 +117,10 @@ def get_comfy_models_folders() -> list[tuple[str, list[str]]]:
     *any* of its base paths lies under the Comfy `models_dir`.
     """
     targets: list[tuple[str, list[str]]] = []
-    models_root = os.path.abspath(folder_paths.models_dir)
+    models_root = _abspath(folder_paths.models_dir)
     for name, values in folder_paths.folder_names_and_paths.items():
         paths, _exts = values[0], values[1]  # NOTE: this prevents nodepacks that hackily edit folder_... from breaking ComfyUI
-        if any(os.path.abspath(p).startswith(models_root + os.sep) for p in paths):
+        if any(_abspath(p).startswith(models_root + os.sep) for p in paths):
             targets.append((name, paths))
     return targets
 
@@ -100,7 +136,7 @@ def resolve_destination_from_tags(tags: list[str]) -> tuple[str, list[str]]:
             raise ValueError(f"unknown model category '{tags[1]}'")
         if not bases:
             raise ValueError(f"no base path configured for category '{tags[1]}'")
-        base_dir = os.path.abspath(bases[0])
+        base_dir = _abspath(bases[0])
         raw_subdirs = tags[2:]
     else:
         base_dir = os.path.abspath(
@@ -174,12 +210,12 @@ def get_relative_to_root_category_path_of_asset(file_path: str) -> tuple[Literal
         return os.path.relpath(os.path.join(os.sep, os.path.relpath(child, parent)), os.sep)
 
     # 1) input
-    input_base = os.path.abspath(folder_paths.get_input_directory())
+    input_base = _abspath(folder_paths.get_input_directory())
     if _is_within(fp_abs, input_base):
         return "input", _rel(fp_abs, input_base)
 
     # 2) output
-    output_base = os.path.abspath(folder_paths.get_output_directory())
+    output_base = _abspath(folder_paths.get_output_directory())
     if _is_within(fp_abs, output_base):
         return "output", _rel(fp_abs, output_base)
 
@@ -187,7 +223,7 @@ def get_relative_to_root_category_path_of_asset(file_path: str) -> tuple[Literal
     best: tuple[int, str, str] | None = None  # (base_len, bucket, rel_inside_bucket)
     for bucket, bases in get_comfy_models_folders():
         for b in bases:
-            base_abs = os.path.abspath(b)
+            base_abs = _abspath(b)
             if not _is_within(fp_abs, base_abs):
                 continue
             cand = (len(base_abs), bucket, _rel(fp_abs, base_abs))
@@ -220,7 +256,7 @@ def get_name_and_tags_from_asset_path(file_path: str) -> tuple[str, list[str]]:
     root_category, some_path = get_relative_to_root_category_path_of_asset(file_path)
     p = Path(some_path)
     parent_parts = [part for part in p.parent.parts if part not in (".", "..", p.anchor)]
-    return p.name, list(dict.fromkeys(normalize_tags([root_category, *parent_parts])))
+    return p.name, normalize_tags([root_category, *parent_parts])
 
 def normalize_tags(tags: list[str] | None) -> list[str]:
     """
@@ -228,36 +264,58 @@ def normalize_tags(tags: list[str] | None) -> list[str]:
       - Stripping whitespace and converting to lowercase.
       - Removing duplicates.
     """
-    return [t.strip().lower() for t in (tags or []) if (t or "").strip()]
+    return list(dict.fromkeys(t.strip().lower() for t in (tags or []) if (t or "").strip()))
 
 def collect_models_files() -> list[str]:
     out: list[str] = []
     for folder_name, bases in get_comfy_models_folders():
         rel_files = folder_paths.get_filename_list(folder_name) or []
+        bases_sorted = _disjoint_dir_prefixes(bases)
         for rel_path in rel_files:
             abs_path = folder_paths.get_full_path(folder_name, rel_path)
             if not abs_path:
                 continue
             abs_path = os.path.abspath(abs_path)
-            allowed = False
-            for b in bases:
-                base_abs = os.path.abspath(b)
-                with contextlib.suppress(Exception):
-                    if os.path.commonpath([abs_path, base_abs]) == base_abs:
-                        allowed = True
-                        break
-            if allowed:
+            # with no base nested in another, only the nearest prefix at or below the path can contain it
+            p = abs_path + os.sep
+            idx = bisect.bisect_right(bases_sorted, p) - 1
+            if idx >= 0 and p.startswith(bases_sorted[idx]):
                 out.append(abs_path)
     return out
 
-def is_scalar(v):
-    if v is None:
-        return True
+def _disjoint_dir_prefixes(bases: list[str]) -> list[str]:
+    """Sorted absolute base directories, each ending in os.sep, with bases nested inside another dropped."""
+    out: list[str] = []
+    # a directory sorts directly before everything beneath it once each prefix carries its separator
+    for prefix in sorted({b if b.endswith(os.sep) else b + os.sep for b in map(_abspath, bases)}):
+        if not out or not prefix.startswith(out[-1]):
+            out.append(prefix)
+    return out
+
+# projection column per exact scalar type; a dict hit replaces the isinstance chain for JSON-decoded values
+_SCALAR_COLUMNS: dict[type, str] = {
+    bool: "val_bool",
+    int: "val_num",
+    float: "val_num",
+    Decimal: "val_num",
+    str: "val_str",
+}
+
+def _scalar_column(v) -> str | None:
+    col = _SCALAR_COLUMNS.get(type(v))
+    if col is not None:
+        return col
+    # subclasses (IntEnum, str-based enums, ...) fall back to the isinstance checks
     if isinstance(v, bool):
-        return True
-    if isinstance(v, (int, float, Decimal, str)):
-        return True
-    return False
+        return "val_bool"
+    if isinstance(v, (int, float, Decimal)):
+        return "val_num"
+    if isinstance(v, str):
+        return "val_str"
+    return None
+
+def is_scalar(v):
+    return v is None or _scalar_column(v) is not None
 
 def project_kv(key: str, value):
     """
@@ -265,8 +323,6 @@ def project_kv(key: str, value):
     Returns list[dict] with keys:
       key, ordinal, and one of val_str / val_num / val_bool / val_json (others None)
     """
-    rows: list[dict] = []
-
     def _null_row(ordinal: int) -> dict:
         return {
             "key": key, "ordinal": ordinal,
@@ -274,39 +330,19 @@ def project_kv(key: str, value):
         }
 
     if value is None:
-        rows.append(_null_row(0))
-        return rows
-
-    if is_scalar(value):
-        if isinstance(value, bool):
-            rows.append({"key": key, "ordinal": 0, "val_bool": bool(value)})
-        elif isinstance(value, (int, float, Decimal)):
-            num = value if isinstance(value, Decimal) else Decimal(str(value))
-            rows.append({"key": key, "ordinal": 0, "val_num": num})
-        elif isinstance(value, str):
-            rows.append({"key": key, "ordinal": 0, "val_str": value})
-        else:
-            rows.append({"key": key, "ordinal": 0, "val_json": value})
-        return rows
-
-    if isinstance(value, list):
-        if all(is_scalar(x) for x in value):
-            for i, x in enumerate(value):
-                if x is None:
-                    rows.append(_null_row(i))
-                elif isinstance(x, bool):
-                    rows.append({"key": key, "ordinal": i, "val_bool": bool(x)})
-                elif isinstance(x, (int, float, Decimal)):
-                    num = x if isinstance(x, Decimal) else Decimal(str(x))
-                    rows.append({"key": key, "ordinal": i, "val_num": num})
-                elif isinstance(x, str):
-                    rows.append({"key": key, "ordinal": i, "val_str": x})
-                else:
-                    rows.append({"key": key, "ordinal": i, "val_json": x})
-            return rows
-        for i, x in enumerate(value):
-            rows.append({"key": key, "ordinal": i, "val_json": x})
-        return rows
-
-    rows.append({"key": key, "ordinal": 0, "val_json": value})
+        return [_null_row(0)]
+
+    if not isinstance(value, list):
+        return [{"key": key, "ordinal": 0, _scalar_column(value) or "val_json": value}]
+
+    rows: list[dict] = []
+    for i, x in enumerate(value):
+        if x is None:
+            rows.append(_null_row(i))
+            continue
+        col = _scalar_column(x)
+        if col is None:
+            # any non-scalar element stores the whole list as JSON rows
+            return [{"key": key, "ordinal": j, "val_json": y} for j, y in enumerate(value)]
+        rows.append({"key": key, "ordinal": i, col: x})
     return rows
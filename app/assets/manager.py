@@ -1,7 +1,10 @@
 import os
+import base64
+import json
 import mimetypes
 import contextlib
-from typing import Sequence
+from datetime import datetime
+from typing import Any, Sequence
 
 from app.database.db import create_session
 from app.assets.api import schemas_out, schemas_in
@@ -30,15 +33,47 @@ from app.assets.helpers import resolve_destination_from_tags, ensure_within_base
 from app.assets.database.models import Asset
 
 
+_SORT_FIELDS = frozenset({"name", "created_at", "updated_at", "size", "last_access_time"})
+_SORT_ORDERS = frozenset({"asc", "desc"})
+
+
 def _safe_sort_field(requested: str | None) -> str:
     if not requested:
         return "created_at"
     v = requested.lower()
-    if v in {"name", "created_at", "updated_at", "size", "last_access_time"}:
+    if v in _SORT_FIELDS:
         return v
     return "created_at"
 
 
+def _encode_list_cursor(sort: str, info) -> str:
+    value = info.asset.size_bytes if sort == "size" else getattr(info, sort)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, info.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_list_cursor(sort: str, cursor: str) -> tuple[Any, str]:
+    """
+    Turn a next_cursor from a previous page into the (sort value, info id) keyset;
+    raises ValueError if it is malformed or was issued for another sort.
+    """
+    try:
+        cursor_sort, value, info_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if cursor_sort != sort or not isinstance(info_id, str):
+            raise ValueError
+        if sort == "size":
+            value = int(value)
+        elif sort != "name":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise ValueError
+    except Exception:
+        raise ValueError(f"invalid cursor for sort '{sort}'") from None
+    return value, info_id
+
+
 def _get_size_mtime_ns(path: str) -> tuple[int, int]:
     st = os.stat(path, follow_symlinks=True)
     return st.st_size, getattr(st, "st_mtime_ns", int(st.st_mtime * 1_000_000_000))
@@ -69,10 +104,23 @@ def list_assets(
     offset: int = 0,
     sort: str = "created_at",
     order: str = "desc",
+    after: tuple[Any, str] | None = None,
+    include_total: bool = True,
     owner_id: str = "",
-) -> schemas_out.AssetsList:
+) -> dict[str, Any]:
+    """
+    Page of assets as a JSON-ready dict shaped like schemas_out.AssetsList (None fields omitted).
+
+    Pages can hold hundreds of rows, so they are built as plain dicts in one pass
+    instead of going through AssetSummary models. Keep the keys in step with
+    schemas_out.AssetsList; the list tests validate responses against it.
+
+    ``after`` is a keyset from decode_list_cursor for the same sort; it replaces offset.
+    """
     sort = _safe_sort_field(sort)
-    order = "desc" if (order or "desc").lower() not in {"asc", "desc"} else order.lower()
+    order = "desc" if (order or "desc").lower() not in _SORT_ORDERS else order.lower()
+    if after is not None:
+        offset = 0
 
     with create_session() as session:
         infos, tag_map, total = list_asset_infos_page(
@@ -82,35 +130,39 @@ def list_assets(
             exclude_tags=exclude_tags,
             name_contains=name_contains,
             metadata_filter=metadata_filter,
-            limit=limit,
+            limit=limit + 1,  # one extra row tells us whether another page exists
             offset=offset,
             sort=sort,
             order=order,
+            after=after,
+            include_total=include_total,
         )
+        has_more = len(infos) > limit
+        infos = infos[:limit]
+        next_cursor = _encode_list_cursor(sort, infos[-1]) if has_more else None
 
-    summaries: list[schemas_out.AssetSummary] = []
+    summaries: list[dict[str, Any]] = []
     for info in infos:
         asset = info.asset
-        tags = tag_map.get(info.id, [])
-        summaries.append(
-            schemas_out.AssetSummary(
-                id=info.id,
-                name=info.name,
-                asset_hash=asset.hash if asset else None,
-                size=int(asset.size_bytes) if asset else None,
-                mime_type=asset.mime_type if asset else None,
-                tags=tags,
-                created_at=info.created_at,
-                updated_at=info.updated_at,
-                last_access_time=info.last_access_time,
-            )
-        )
-
-    return schemas_out.AssetsList(
-        assets=summaries,
-        total=total,
-        has_more=(offset + len(summaries)) < total,
-    )
+        item: dict[str, Any] = {"id": info.id, "name": info.name}
+        if asset:
+            if asset.hash is not None:
+                item["asset_hash"] = asset.hash
+            item["size"] = int(asset.size_bytes)
+            if asset.mime_type is not None:
+                item["mime_type"] = asset.mime_type
+        item["tags"] = tag_map.get(info.id, [])
+        item["created_at"] = info.created_at.isoformat()
+        item["updated_at"] = info.updated_at.isoformat()
+        item["last_access_time"] = info.last_access_time.isoformat()
+        summaries.append(item)
+
+    payload: dict[str, Any] = {"assets": summaries, "has_more": has_more}
+    if total is not None:
+        payload["total"] = total
+    if next_cursor is not None:
+        payload["next_cursor"] = next_cursor
+    return payload
 
 
 def get_asset(
@@ -125,7 +177,7 @@ def get_asset(
         info, asset, tag_names = res
         preview_id = info.preview_id
 
-    return schemas_out.AssetDetail(
+    return schemas_out.AssetDetail.model_construct(
         id=info.id,
         name=info.name,
         asset_hash=asset.hash if asset else None,
@@ -205,7 +257,7 @@ def upload_asset_from_temp_path(
             tag_names = get_asset_tags(session, asset_info_id=info.id)
             session.commit()
 
-            return schemas_out.AssetCreated(
+            return schemas_out.AssetCreated.model_construct(
                 id=info.id,
                 name=info.name,
                 asset_hash=existing.hash,
@@ -271,7 +323,7 @@ def upload_asset_from_temp_path(
             raise RuntimeError("inconsistent DB state after ingest")
         info, asset = pair
         tag_names = get_asset_tags(session, asset_info_id=info.id)
-        created_result = schemas_out.AssetCreated(
+        created_result = schemas_out.AssetCreated.model_construct(
             id=info.id,
             name=info.name,
             asset_hash=asset.hash,
@@ -315,10 +367,11 @@ def update_asset(
         )
 
         tag_names = get_asset_tags(session, asset_info_id=asset_info_id)
-        result = schemas_out.AssetUpdated(
+        asset = session.get(Asset, info.asset_id)
+        result = schemas_out.AssetUpdated.model_construct(
             id=info.id,
             name=info.name,
-            asset_hash=info.asset.hash if info.asset else None,
+            asset_hash=asset.hash if asset else None,
             tags=tag_names,
             user_metadata=info.user_metadata or {},
             updated_at=info.updated_at,
@@ -351,7 +404,7 @@ def set_asset_preview(
         if not res:
             raise RuntimeError("State changed during preview update")
         info, asset, tags = res
-        result = schemas_out.AssetDetail(
+        result = schemas_out.AssetDetail.model_construct(
             id=info.id,
             name=info.name,
             asset_hash=asset.hash if asset else None,
@@ -425,7 +478,7 @@ def create_asset_from_hash(
             owner_id=owner_id,
         )
         tag_names = get_asset_tags(session, asset_info_id=info.id)
-        result = schemas_out.AssetCreated(
+        result = schemas_out.AssetCreated.model_construct(
             id=info.id,
             name=info.name,
             asset_hash=asset.hash,
@@ -465,7 +518,7 @@ def add_tags_to_asset(
             asset_info_row=info_row,
         )
         session.commit()
-    return schemas_out.TagsAdd(**data)
+    return schemas_out.TagsAdd.model_construct(**data)
 
 
 def remove_tags_from_asset(
@@ -487,7 +540,7 @@ def remove_tags_from_asset(
             tags=tags,
         )
         session.commit()
-    return schemas_out.TagsRemove(**data)
+    return schemas_out.TagsRemove.model_construct(**data)
 
 
 def list_tags(
@@ -497,7 +550,9 @@ def list_tags(
     order: str = "count_desc",
     include_zero: bool = True,
     owner_id: str = "",
-) -> schemas_out.TagsList:
+) -> dict[str, Any]:
+    """JSON-ready dict shaped like schemas_out.TagsList (validated against it in the tag tests); built
+    directly for the same reason as list_assets."""
     limit = max(1, min(1000, limit))
     offset = max(0, offset)
 
@@ -512,5 +567,5 @@ def list_tags(
             owner_id=owner_id,
         )
 
-    tags = [schemas_out.TagUsage(name=name, count=count, type=tag_type) for (name, tag_type, count) in rows]
-    return schemas_out.TagsList(tags=tags, total=total, has_more=(offset + len(tags)) < total)
+    tags = [{"name": name, "count": count, "type": tag_type} for (name, tag_type, count) in rows]
+    return {"tags": tags, "total": total, "has_more": (offset + len(tags)) < total}
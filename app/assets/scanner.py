@@ -1,20 +1,50 @@
 import contextlib
+import functools
+import itertools
 import time
 import logging
 import os
 import sqlalchemy
+from concurrent.futures import ThreadPoolExecutor
 
 import folder_paths
 from app.database.db import create_session, dependencies_available
 from app.assets.helpers import (
     collect_models_files, compute_relative_filename, fast_asset_file_check, get_name_and_tags_from_asset_path,
-    list_tree,prefixes_for_root, escape_like_prefix,
+    list_tree, prefix_range, prefixes_for_root,
     RootType
 )
-from app.assets.database.tags import add_missing_tag_for_asset_id, ensure_tags_exist, remove_missing_tag_for_asset_id
-from app.assets.database.bulk_ops import seed_from_paths_batch
+from app.assets.database.tags import add_missing_tag_for_asset_ids, ensure_tags_exist, remove_missing_tag_for_asset_ids
+from app.assets.database.bulk_ops import MAX_BIND_PARAMS, iter_chunks, seed_from_paths_batch
 from app.assets.database.models import Asset, AssetCacheState, AssetInfo
 
+SEED_BATCH_SIZE = 5000
+# os.stat releases the GIL, so a cold-cache scan overlaps its metadata reads across threads
+STAT_WORKERS = min(32, 4 * (os.cpu_count() or 1))
+
+
+def _stat_or_none(path: str, *, follow_symlinks: bool) -> os.stat_result | None:
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    except OSError:
+        return None
+
+
+def _under_prefixes(prefixes: list[str]):
+    """file_path lies under any of the given directories, as B-tree range predicates on file_path."""
+    conds = []
+    for p in prefixes:
+        base = os.path.abspath(p)
+        if not base.endswith(os.sep):
+            base += os.sep
+        lo, hi = prefix_range(base)
+        conds.append(sqlalchemy.and_(AssetCacheState.file_path >= lo, AssetCacheState.file_path < hi))
+    return sqlalchemy.or_(*conds)
+
+
+# per-connection scratch table of [lo, hi) root ranges for the prune anti-join
+_PREFIXES = sqlalchemy.table("_scan_prefixes", sqlalchemy.column("lo"), sqlalchemy.column("hi"))
+
 
 def seed_assets(roots: tuple[RootType, ...], enable_logging: bool = False) -> None:
     """
@@ -51,19 +81,22 @@ def seed_assets(roots: tuple[RootType, ...], enable_logging: bool = False) -> No
         if "output" in roots:
             paths.extend(list_tree(folder_paths.get_output_directory()))
 
-        specs: list[dict] = []
-        tag_pool: set[str] = set()
+        new_paths: list[str] = []
         for p in paths:
             abs_p = os.path.abspath(p)
             if abs_p in existing_paths:
                 skipped_existing += 1
                 continue
-            try:
-                stat_p = os.stat(abs_p, follow_symlinks=False)
-            except OSError:
-                continue
-            # skip empty files
-            if not stat_p.st_size:
+            new_paths.append(abs_p)
+
+        with ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+            stats = list(pool.map(functools.partial(_stat_or_none, follow_symlinks=False), new_paths, chunksize=64))
+
+        specs: list[dict] = []
+        tag_pool: set[str] = set()
+        for abs_p, stat_p in zip(new_paths, stats):
+            # skip unreadable and empty files
+            if stat_p is None or not stat_p.st_size:
                 continue
             name, tags = get_name_and_tags_from_asset_path(abs_p)
             specs.append(
@@ -84,10 +117,19 @@ def seed_assets(roots: tuple[RootType, ...], enable_logging: bool = False) -> No
         with create_session() as sess:
             if tag_pool:
                 ensure_tags_exist(sess, tag_pool, tag_type="user")
+                sess.commit()
 
-            result = seed_from_paths_batch(sess, specs=specs, owner_id="")
-            created += result["inserted_infos"]
-            sess.commit()
+            # commit per batch so the journal doesn't have to hold the whole seed
+            for batch in iter_chunks(specs, SEED_BATCH_SIZE):
+                result = seed_from_paths_batch(sess, specs=batch, owner_id="")
+                created += result["inserted_infos"]
+                sess.commit()
+            if created and sess.get_bind().dialect.name == "sqlite":
+                # let SQLite refresh planner statistics only for tables whose stats went stale,
+                # sampling a bounded number of rows per index instead of a full ANALYZE
+                sess.execute(sqlalchemy.text("PRAGMA analysis_limit=400"))
+                sess.execute(sqlalchemy.text("PRAGMA optimize"))
+                sess.commit()
     finally:
         if enable_logging:
             logging.info(
@@ -107,25 +149,35 @@ def _prune_orphaned_assets(roots: tuple[RootType, ...]) -> int:
     if not all_prefixes:
         return 0
 
-    def make_prefix_condition(prefix: str):
-        base = prefix if prefix.endswith(os.sep) else prefix + os.sep
-        escaped, esc = escape_like_prefix(base)
-        return AssetCacheState.file_path.like(escaped + "%", escape=esc)
+    ranges = {prefix_range(p if p.endswith(os.sep) else p + os.sep) for p in all_prefixes}
+    outside_prefixes = ~sqlalchemy.exists().where(
+        AssetCacheState.file_path >= _PREFIXES.c.lo,
+        AssetCacheState.file_path < _PREFIXES.c.hi,
+    )
 
-    matches_valid_prefix = sqlalchemy.or_(*[make_prefix_condition(p) for p in all_prefixes])
-
-    orphan_subq = (
-        sqlalchemy.select(Asset.id)
-        .outerjoin(AssetCacheState, AssetCacheState.asset_id == Asset.id)
-        .where(Asset.hash.is_(None), AssetCacheState.id.is_(None))
-    ).scalar_subquery()
+    # seed assets no cache state points at; walks ix_assets_unhashed, probes ix_asset_cache_state_asset_id
+    orphans = sqlalchemy.select(Asset.id).where(
+        Asset.hash.is_(None),
+        ~sqlalchemy.exists().where(AssetCacheState.asset_id == Asset.id),
+    )
 
     with create_session() as sess:
-        sess.execute(sqlalchemy.delete(AssetCacheState).where(~matches_valid_prefix))
-        sess.execute(sqlalchemy.delete(AssetInfo).where(AssetInfo.asset_id.in_(orphan_subq)))
-        result = sess.execute(sqlalchemy.delete(Asset).where(Asset.id.in_(orphan_subq)))
+        sess.execute(sqlalchemy.text(
+            "CREATE TEMP TABLE IF NOT EXISTS _scan_prefixes (lo TEXT NOT NULL PRIMARY KEY, hi TEXT NOT NULL)"
+        ))
+        sess.execute(sqlalchemy.delete(_PREFIXES))
+        sess.execute(sqlalchemy.insert(_PREFIXES), [{"lo": lo, "hi": hi} for lo, hi in ranges])
+        sess.execute(sqlalchemy.delete(AssetCacheState).where(outside_prefixes))
+        # resolve the orphans once instead of re-running the anti-join for each table
+        orphan_ids = sess.execute(orphans).scalars().all()
+        ids = sqlalchemy.bindparam("ids", expanding=True)
+        del_infos = sqlalchemy.delete(AssetInfo).where(AssetInfo.asset_id.in_(ids))
+        del_assets = sqlalchemy.delete(Asset).where(Asset.id.in_(ids))
+        for chunk in iter_chunks(orphan_ids, MAX_BIND_PARAMS):
+            sess.execute(del_infos, {"ids": chunk})
+            sess.execute(del_assets, {"ids": chunk})
         sess.commit()
-        return result.rowcount
+        return len(orphan_ids)
 
 
 def _fast_db_consistency_pass(
@@ -145,119 +197,96 @@ def _fast_db_consistency_pass(
     if not prefixes:
         return set() if collect_existing_paths else None
 
-    conds = []
-    for p in prefixes:
-        base = os.path.abspath(p)
-        if not base.endswith(os.sep):
-            base += os.sep
-        escaped, esc = escape_like_prefix(base)
-        conds.append(AssetCacheState.file_path.like(escaped + "%", escape=esc))
-
-    with create_session() as sess:
-        rows = (
-            sess.execute(
-                sqlalchemy.select(
-                    AssetCacheState.id,
-                    AssetCacheState.file_path,
-                    AssetCacheState.mtime_ns,
-                    AssetCacheState.needs_verify,
-                    AssetCacheState.asset_id,
-                    Asset.hash,
-                    Asset.size_bytes,
-                )
-                .join(Asset, Asset.id == AssetCacheState.asset_id)
-                .where(sqlalchemy.or_(*conds))
-                .order_by(AssetCacheState.asset_id.asc(), AssetCacheState.id.asc())
+    with create_session() as sess, ThreadPoolExecutor(max_workers=STAT_WORKERS) as pool:
+        rows = sess.execute(
+            sqlalchemy.select(
+                AssetCacheState.id,
+                AssetCacheState.file_path,
+                AssetCacheState.mtime_ns,
+                AssetCacheState.needs_verify,
+                AssetCacheState.asset_id,
+                Asset.hash,
+                Asset.size_bytes,
             )
-        ).all()
-
-        by_asset: dict[str, dict] = {}
-        for sid, fp, mtime_db, needs_verify, aid, a_hash, a_size in rows:
-            acc = by_asset.get(aid)
-            if acc is None:
-                acc = {"hash": a_hash, "size_db": int(a_size or 0), "states": []}
-                by_asset[aid] = acc
-
-            fast_ok = False
-            try:
-                exists = True
-                fast_ok = fast_asset_file_check(
-                    mtime_db=mtime_db,
-                    size_db=acc["size_db"],
-                    stat_result=os.stat(fp, follow_symlinks=True),
-                )
-            except FileNotFoundError:
-                exists = False
-            except OSError:
-                exists = False
-
-            acc["states"].append({
-                "sid": sid,
-                "fp": fp,
-                "exists": exists,
-                "fast_ok": fast_ok,
-                "needs_verify": bool(needs_verify),
-            })
+            .join(Asset, Asset.id == AssetCacheState.asset_id)
+            .where(_under_prefixes(prefixes))
+            .order_by(AssetCacheState.asset_id.asc(), AssetCacheState.id.asc())
+            .execution_options(yield_per=1000)  # stream rows instead of materializing them all up front
+        )
 
         to_set_verify: list[int] = []
         to_clear_verify: list[int] = []
         stale_state_ids: list[int] = []
+        orphan_seed_ids: list[str] = []
+        missing_asset_ids: list[str] = []
+        present_asset_ids: list[str] = []
         survivors: set[str] = set()
 
-        for aid, acc in by_asset.items():
-            a_hash = acc["hash"]
-            states = acc["states"]
-            any_fast_ok = any(s["fast_ok"] for s in states)
-            all_missing = all(not s["exists"] for s in states)
+        stat_path = functools.partial(_stat_or_none, follow_symlinks=True)
+        # each streamed partition is stat'ed across the pool before its rows are walked
+        stated = (
+            (row, st)
+            for part in rows.partitions()
+            for row, st in zip(part, pool.map(stat_path, [r.file_path for r in part], chunksize=64))
+        )
 
-            for s in states:
-                if not s["exists"]:
-                    continue
-                if s["fast_ok"] and s["needs_verify"]:
-                    to_clear_verify.append(s["sid"])
-                if not s["fast_ok"] and not s["needs_verify"]:
-                    to_set_verify.append(s["sid"])
+        # rows arrive ordered by asset_id, so each asset is settled as soon as its group ends and
+        # only the id lists above outlive the stream
+        for aid, group in itertools.groupby(stated, key=lambda rs: rs[0].asset_id):
+            states: list[tuple[int, str, bool, bool]] = []  # (sid, fp, exists, fast_ok)
+            a_hash = None
+            for (sid, fp, mtime_db, needs_verify, _aid, a_hash, a_size), st in group:
+                exists = st is not None
+                fast_ok = exists and fast_asset_file_check(
+                    mtime_db=mtime_db,
+                    size_db=int(a_size or 0),
+                    stat_result=st,
+                )
+
+                if exists:
+                    if fast_ok and needs_verify:
+                        to_clear_verify.append(sid)
+                    if not fast_ok and not needs_verify:
+                        to_set_verify.append(sid)
+                states.append((sid, fp, exists, fast_ok))
 
             if a_hash is None:
-                if states and all_missing:  # remove seed Asset completely, if no valid AssetCache exists
-                    sess.execute(sqlalchemy.delete(AssetInfo).where(AssetInfo.asset_id == aid))
-                    asset = sess.get(Asset, aid)
-                    if asset:
-                        sess.delete(asset)
-                else:
-                    for s in states:
-                        if s["exists"]:
-                            survivors.add(os.path.abspath(s["fp"]))
-                continue
+                if not any(exists for _sid, _fp, exists, _ok in states):
+                    # remove seed Asset completely, if no valid AssetCache exists
+                    orphan_seed_ids.append(aid)
+                    continue
+            elif any(fast_ok for _sid, _fp, _exists, fast_ok in states):
+                # if Asset has at least one valid AssetCache record, remove any invalid AssetCache records
+                stale_state_ids.extend(sid for sid, _fp, exists, _ok in states if not exists)
+                present_asset_ids.append(aid)
+            else:
+                missing_asset_ids.append(aid)
 
-            if any_fast_ok:  # if Asset has at least one valid AssetCache record, remove any invalid AssetCache records
-                for s in states:
-                    if not s["exists"]:
-                        stale_state_ids.append(s["sid"])
-                if update_missing_tags:
-                    with contextlib.suppress(Exception):
-                        remove_missing_tag_for_asset_id(sess, asset_id=aid)
-            elif update_missing_tags:
-                with contextlib.suppress(Exception):
-                    add_missing_tag_for_asset_id(sess, asset_id=aid, origin="automatic")
-
-            for s in states:
-                if s["exists"]:
-                    survivors.add(os.path.abspath(s["fp"]))
-
-        if stale_state_ids:
-            sess.execute(sqlalchemy.delete(AssetCacheState).where(AssetCacheState.id.in_(stale_state_ids)))
-        if to_set_verify:
-            sess.execute(
-                sqlalchemy.update(AssetCacheState)
-                .where(AssetCacheState.id.in_(to_set_verify))
-                .values(needs_verify=True)
-            )
-        if to_clear_verify:
-            sess.execute(
-                sqlalchemy.update(AssetCacheState)
-                .where(AssetCacheState.id.in_(to_clear_verify))
-                .values(needs_verify=False)
-            )
+            survivors.update(os.path.abspath(fp) for _sid, fp, exists, _ok in states if exists)
+
+        if update_missing_tags:
+            with contextlib.suppress(Exception):
+                remove_missing_tag_for_asset_ids(sess, asset_ids=present_asset_ids)
+            with contextlib.suppress(Exception):
+                add_missing_tag_for_asset_ids(sess, asset_ids=missing_asset_ids, origin="automatic")
+
+        ids = sqlalchemy.bindparam("ids", expanding=True)
+        del_infos = sqlalchemy.delete(AssetInfo).where(AssetInfo.asset_id.in_(ids))
+        del_assets = sqlalchemy.delete(Asset).where(Asset.id.in_(ids))
+        del_states = sqlalchemy.delete(AssetCacheState).where(AssetCacheState.id.in_(ids))
+        set_verify = (
+            sqlalchemy.update(AssetCacheState)
+            .where(AssetCacheState.id.in_(ids))
+            .values(needs_verify=sqlalchemy.bindparam("flag"))
+        )
+        for chunk in iter_chunks(orphan_seed_ids, MAX_BIND_PARAMS):
+            sess.execute(del_infos, {"ids": chunk})
+            sess.execute(del_assets, {"ids": chunk})
+        for chunk in iter_chunks(stale_state_ids, MAX_BIND_PARAMS):
+            sess.execute(del_states, {"ids": chunk})
+        for chunk in iter_chunks(to_set_verify, MAX_BIND_PARAMS):
+            sess.execute(set_verify, {"ids": chunk, "flag": True})
+        for chunk in iter_chunks(to_clear_verify, MAX_BIND_PARAMS):
+            sess.execute(set_verify, {"ids": chunk, "flag": False})
         sess.commit()
         return survivors if collect_existing_paths else None
@@ -1,6 +1,6 @@
 import logging
 import os
-import shutil
+import sqlite3
 from app.logger import log_startup_warning
 from utils.install_util import get_missing_requirements_message
 from comfy.cli_args import args
@@ -14,7 +14,7 @@ try:
     from alembic.config import Config
     from alembic.runtime.migration import MigrationContext
     from alembic.script import ScriptDirectory
-    from sqlalchemy import create_engine
+    from sqlalchemy import create_engine, event
     from sqlalchemy.orm import sessionmaker
 
     _DB_AVAILABLE = True
@@ -65,6 +65,32 @@ def get_db_path():
         raise ValueError(f"Unsupported database URL '{url}'.")
 
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """WAL lets readers run alongside the writer and, with synchronous=NORMAL, a commit no longer
+    waits on an fsync of the main database file. foreign_keys makes SQLite enforce the schema's
+    ON DELETE actions, which the models rely on (passive_deletes) instead of deleting children."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _sqlite_copy(src_path: str, dst_path: str) -> None:
+    """Copy a database with SQLite's backup API; unlike a file copy it reads committed WAL
+    content from the source and writes the target through its own journal, so stale
+    -wal/-shm files next to the target can't be replayed over the copy."""
+    src = sqlite3.connect(src_path)
+    try:
+        dst = sqlite3.connect(dst_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
 def init_db():
     db_url = args.database_url
     logging.debug(f"Database URL: {db_url}")
@@ -74,7 +100,9 @@ def init_db():
     config = get_alembic_config()
 
     # Check if we need to upgrade
-    engine = create_engine(db_url)
+    # the asset scanner and tag paths cycle through many distinct statements; keep them all compiled
+    engine = create_engine(db_url, query_cache_size=1200)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
     conn = engine.connect()
 
     context = MigrationContext.configure(conn)
@@ -89,7 +117,7 @@ def init_db():
         # Backup the database pre upgrade
         backup_path = db_path + ".bkp"
         if db_exists:
-            shutil.copy(db_path, backup_path)
+            _sqlite_copy(db_path, backup_path)
         else:
             backup_path = None
 
@@ -99,7 +127,9 @@ def init_db():
         except Exception as e:
             if backup_path:
                 # Restore the database from backup if upgrade fails
-                shutil.copy(backup_path, db_path)
+                conn.close()
+                engine.dispose()
+                _sqlite_copy(backup_path, db_path)
                 os.remove(backup_path)
             logging.exception("Error upgrading database: ")
             raise e
@@ -0,0 +1,108 @@
+import itertools
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from app.assets.database import bulk_ops
+from app.assets.database.models import Asset, AssetCacheState, AssetInfo, AssetInfoMeta, AssetInfoTag, Tag
+from app.database.db import _set_sqlite_pragmas
+from app.database.models import Base
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, 678901)
+TABLES = ("assets", "asset_cache_state", "assets_info", "asset_info_tags", "asset_info_meta")
+
+
+@pytest.fixture
+def make_session(tmp_path):
+    sessions: list[Session] = []
+
+    def _make(name: str) -> Session:
+        engine = create_engine(f"sqlite:///{tmp_path / name}")
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        Base.metadata.create_all(engine)
+        session = Session(engine)
+        session.add_all([Tag(name="input", tag_type="system"), Tag(name="sub", tag_type="user")])
+        session.commit()
+        sessions.append(session)
+        return session
+
+    yield _make
+    for s in sessions:
+        s.close()
+        s.get_bind().dispose()
+
+
+@pytest.fixture
+def fixed_ids(monkeypatch):
+    counter = itertools.count(1)
+    monkeypatch.setattr(bulk_ops, "uuid7", lambda: f"00000000-0000-7000-8000-{next(counter):012d}")
+    monkeypatch.setattr(bulk_ops, "utcnow", lambda: NOW)
+
+
+def _stored_rows(session: Session, table: str) -> list[tuple]:
+    """Rows as SQLite stored them, with each value's Python type so e.g. 1 and 1.0 don't compare equal."""
+    rows = session.connection().exec_driver_sql(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+    return [tuple((type(v).__name__, v) for v in row) for row in rows]
+
+
+def test_seed_batch_stores_same_rows_as_orm(make_session, fixed_ids, tmp_path):
+    specs = [
+        {"abs_path": str(tmp_path / "in" / "a.bin"), "size_bytes": 10, "mtime_ns": 1_700_000_000_123_456_789,
+         "info_name": "a.bin", "tags": ["input"], "fname": "a.bin"},
+        {"abs_path": str(tmp_path / "in" / "sub" / "b.bin"), "size_bytes": 2**40, "mtime_ns": 5,
+         "info_name": "b.bin", "tags": ["input", "sub"], "fname": "sub/b.bin"},
+        {"abs_path": str(tmp_path / "in" / "c.bin"), "size_bytes": 1, "mtime_ns": 7,
+         "info_name": "c.bin", "tags": [], "fname": None},
+    ]
+    meta_rows = [
+        {"asset_info_id": "00000000-0000-7000-8000-000000000002", "key": "score", "ordinal": 0,
+         "val_str": None, "val_num": 1.5, "val_bool": None, "val_json": None},
+        {"asset_info_id": "00000000-0000-7000-8000-000000000002", "key": "flag", "ordinal": 0,
+         "val_str": None, "val_num": None, "val_bool": True, "val_json": None},
+        {"asset_info_id": "00000000-0000-7000-8000-000000000004", "key": "flag", "ordinal": 1,
+         "val_str": None, "val_num": None, "val_bool": False, "val_json": None},
+        {"asset_info_id": "00000000-0000-7000-8000-000000000004", "key": "cfg", "ordinal": 0,
+         "val_str": None, "val_num": None, "val_bool": None, "val_json": {"a": [1, True], "b": None}},
+    ]
+
+    seeded = make_session("seeded.db")
+    result = bulk_ops.seed_from_paths_batch(seeded, specs=specs)
+    assert result == {"inserted_infos": 3, "won_states": 3, "lost_states": 0}
+    bulk_ops.bulk_insert_tags_and_meta(seeded, tag_rows=[], meta_rows=meta_rows)
+    seeded.commit()
+
+    orm = make_session("orm.db")
+    for i, sp in enumerate(specs):
+        # seed_from_paths_batch draws an asset id then an info id per spec
+        aid, iid = f"00000000-0000-7000-8000-{2 * i + 1:012d}", f"00000000-0000-7000-8000-{2 * i + 2:012d}"
+        orm.add(Asset(id=aid, hash=None, size_bytes=sp["size_bytes"], mime_type=None, created_at=NOW))
+        orm.flush()
+        orm.add(AssetCacheState(asset_id=aid, file_path=sp["abs_path"], mtime_ns=sp["mtime_ns"]))
+        orm.add(AssetInfo(
+            id=iid, owner_id="", name=sp["info_name"], asset_id=aid, preview_id=None,
+            user_metadata={"filename": sp["fname"]} if sp["fname"] else None,
+            created_at=NOW, updated_at=NOW, last_access_time=NOW,
+        ))
+        orm.flush()
+        orm.add_all([AssetInfoTag(asset_info_id=iid, tag_name=t, origin="automatic", added_at=NOW) for t in sp["tags"]])
+        if sp["fname"]:
+            orm.add(AssetInfoMeta(asset_info_id=iid, key="filename", ordinal=0, val_str=sp["fname"]))
+        orm.flush()
+    orm.add_all([AssetInfoMeta(**row) for row in meta_rows])
+    orm.commit()
+
+    for table in TABLES:
+        assert _stored_rows(seeded, table) == _stored_rows(orm, table), table
+
+
+def test_executemany_requires_values_for_non_scalar_defaults(make_session):
+    session = make_session("t.db")
+    session.add(Asset(id="a1", size_bytes=1, created_at=NOW))
+    session.flush()
+    row = {"id": "i1", "owner_id": "", "name": "n", "asset_id": "a1", "updated_at": NOW, "last_access_time": NOW}
+    # created_at defaults to a Python callable, which can't be bound once for the whole batch
+    with pytest.raises(KeyError, match="assets_info.created_at"):
+        bulk_ops._executemany(session, sqlite.insert(AssetInfo), [row])
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+from app.assets.database.models import AssetCacheState
+from app.assets.database.queries import ingest_fs_asset
+from app.database.db import _set_sqlite_pragmas
+from app.database.models import Base
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        yield s
+    engine.dispose()
+
+
+def _state_flags(result: dict) -> tuple[bool, bool]:
+    return result["state_created"], result["state_updated"]
+
+
+def test_ingest_reports_state_created_and_updated(session, tmp_path):
+    path = str(tmp_path / "a.bin")
+
+    def ingest(asset_hash: str, mtime_ns: int) -> dict:
+        return ingest_fs_asset(session, asset_hash=asset_hash, abs_path=path, size_bytes=3, mtime_ns=mtime_ns)
+
+    assert _state_flags(ingest("blake3:aa", 1)) == (True, False)
+    assert _state_flags(ingest("blake3:aa", 1)) == (False, False)
+    assert _state_flags(ingest("blake3:aa", 2)) == (False, True)
+    assert _state_flags(ingest("blake3:bb", 2)) == (False, True)
+    session.commit()
+
+    state = session.execute(select(AssetCacheState)).scalar_one()
+    assert state.mtime_ns == 2
+    assert state.asset.hash == "blake3:bb"
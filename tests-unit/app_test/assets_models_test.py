@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.assets.database.models import Asset, AssetInfo, AssetInfoTag, Tag
+from app.database.models import Base
+
+NOW = datetime(2026, 1, 2, 3, 4, 5)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        s.add_all([Tag(name="input", tag_type="system"), Asset(id="a1", size_bytes=1, created_at=NOW)])
+        s.flush()
+        s.add(AssetInfo(id="i1", owner_id="", name="n", asset_id="a1",
+                        created_at=NOW, updated_at=NOW, last_access_time=NOW))
+        s.flush()
+        s.add(AssetInfoTag(asset_info_id="i1", tag_name="input", origin="manual", added_at=NOW))
+        s.commit()
+        s.expunge_all()
+        yield s
+    engine.dispose()
+
+
+def test_asset_info_to_dict_without_loaded_tags(session):
+    info = session.get(AssetInfo, "i1")
+    data = info.to_dict()
+    assert data["id"] == "i1" and "tags" not in data
+    assert info.to_dict(tags=["input"])["tags"] == ["input"]
+
+
+def test_asset_info_to_dict_with_eager_loaded_tags(session):
+    info = session.execute(select(AssetInfo).options(selectinload(AssetInfo.tags))).scalar_one()
+    assert info.to_dict()["tags"] == ["input"]
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+
+import pytest
+
+from app.database import db
+
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")]
+        return tables, conn.execute("SELECT x FROM t ORDER BY x").fetchall()
+    finally:
+        conn.close()
+
+
+def test_failed_upgrade_restores_backup_over_stale_wal(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "comfy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.commit()
+    conn.close()
+    before = _rows(db_path)
+
+    # the failed migration leaves its changes in a WAL that a still-open connection keeps around
+    leftover = sqlite3.connect(db_path)
+    leftover.execute("PRAGMA wal_autocheckpoint=0")
+
+    def failing_upgrade(config, rev):
+        leftover.execute("INSERT INTO t VALUES (2)")
+        leftover.execute("CREATE TABLE junk (y INTEGER)")
+        leftover.commit()
+        raise RuntimeError("migration failed")
+
+    monkeypatch.setattr(db.args, "database_url", f"sqlite:///{db_path}")
+    monkeypatch.setattr(db.command, "upgrade", failing_upgrade)
+    with pytest.raises(RuntimeError, match="migration failed"):
+        db.init_db()
+
+    assert _rows(db_path) == before
+    leftover.close()
+    assert _rows(db_path) == before
+    assert not os.path.exists(db_path + ".bkp")
@@ -2,6 +2,7 @@ import contextlib
 import json
 import os
 import socket
+import sqlite3
 import subprocess
 import sys
 import tempfile
@@ -78,7 +79,17 @@ def comfy_tmp_base_dir() -> Path:
 
 
 @pytest.fixture(scope="session")
-def comfy_url_and_proc(comfy_tmp_base_dir: Path, request: pytest.FixtureRequest):
+def comfy_db_url(comfy_tmp_base_dir: Path, request: pytest.FixtureRequest) -> str:
+    db_url = request.config.getoption("--db-url")
+    if not db_url:
+        # Use a file-backed sqlite database in the temp directory
+        db_path = comfy_tmp_base_dir / "assets-test.sqlite3"
+        db_url = f"sqlite:///{db_path}"
+    return db_url
+
+
+@pytest.fixture(scope="session")
+def comfy_url_and_proc(comfy_tmp_base_dir: Path, comfy_db_url: str):
     """
     Boot ComfyUI subprocess with:
       - sandbox base dir
@@ -87,11 +98,7 @@ def comfy_url_and_proc(comfy_tmp_base_dir: Path, request: pytest.FixtureRequest)
     Returns (base_url, process, port)
     """
     port = _free_port()
-    db_url = request.config.getoption("--db-url")
-    if not db_url:
-        # Use a file-backed sqlite database in the temp directory
-        db_path = comfy_tmp_base_dir / "assets-test.sqlite3"
-        db_url = f"sqlite:///{db_path}"
+    db_url = comfy_db_url
 
     logs_dir = comfy_tmp_base_dir / "logs"
     logs_dir.mkdir(exist_ok=True)
@@ -150,6 +157,23 @@ def comfy_url_and_proc(comfy_tmp_base_dir: Path, request: pytest.FixtureRequest)
     err_log.close()
 
 
+@pytest.fixture
+def db_query(comfy_db_url: str) -> Callable[..., list[tuple]]:
+    """
+    Returns query(sql, *params) -> rows, read from the server's sqlite database over a
+    separate connection, for checks the HTTP API can't express (e.g. child rows of deleted assets).
+    """
+    if not comfy_db_url.startswith("sqlite:///"):
+        pytest.skip("requires a file-backed sqlite database")
+    db_path = comfy_db_url[len("sqlite:///"):]
+
+    def _query(sql: str, *params) -> list[tuple]:
+        with contextlib.closing(sqlite3.connect(db_path)) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    return _query
+
+
 @pytest.fixture
 def http() -> Iterator[requests.Session]:
     with requests.Session() as s:
@@ -87,6 +87,45 @@ def test_delete_upon_reference_count(
     assert rh2.status_code == 404  # orphan content removed
 
 
+def test_delete_removes_dependent_rows(
+    http: requests.Session, api_base: str, seeded_asset: dict, db_query
+):
+    """Tag, meta and cache-state rows go with their AssetInfo / Asset through the schema's ON DELETE CASCADE."""
+    aid = seeded_asset["id"]
+    payload = {
+        "hash": seeded_asset["asset_hash"],
+        "name": "cascade_second.safetensors",
+        "tags": ["models", "checkpoints", "unit-tests", "cascade"],
+        "user_metadata": {"k": "v"},
+    }
+    r = http.post(f"{api_base}/api/assets/from-hash", json=payload, timeout=120)
+    second = r.json()
+    assert r.status_code == 201, second
+    [(asset_id,)] = db_query("SELECT asset_id FROM assets_info WHERE id = ?", aid)
+
+    def _count(table: str, column: str, value: str) -> int:
+        return db_query(f"SELECT COUNT(*) FROM {table} WHERE {column} = ?", value)[0][0]
+
+    assert _count("asset_info_tags", "asset_info_id", aid) > 0
+    assert _count("asset_info_meta", "asset_info_id", aid) > 0
+    assert _count("asset_cache_state", "asset_id", asset_id) > 0
+
+    # first reference: its own rows go, the shared asset and its cache state stay
+    assert http.delete(f"{api_base}/api/assets/{aid}", timeout=120).status_code == 204
+    assert _count("assets_info", "id", aid) == 0
+    assert _count("asset_info_tags", "asset_info_id", aid) == 0
+    assert _count("asset_info_meta", "asset_info_id", aid) == 0
+    assert _count("assets", "id", asset_id) == 1
+    assert _count("asset_cache_state", "asset_id", asset_id) > 0
+
+    # last reference: the asset goes too, taking its cache states with it
+    assert http.delete(f"{api_base}/api/assets/{second['id']}", timeout=120).status_code == 204
+    assert _count("asset_info_tags", "asset_info_id", second["id"]) == 0
+    assert _count("asset_info_meta", "asset_info_id", second["id"]) == 0
+    assert _count("assets", "id", asset_id) == 0
+    assert _count("asset_cache_state", "asset_id", asset_id) == 0
+
+
 def test_update_asset_fields(http: requests.Session, api_base: str, seeded_asset: dict):
     aid = seeded_asset["id"]
     original_tags = seeded_asset["tags"]
@@ -105,6 +144,34 @@ def test_update_asset_fields(http: requests.Session, api_base: str, seeded_asset
     assert "filename" in body["user_metadata"]
 
 
+def test_get_asset_etag_and_not_modified(http: requests.Session, api_base: str, seeded_asset: dict):
+    aid = seeded_asset["id"]
+
+    r1 = http.get(f"{api_base}/api/assets/{aid}", timeout=120)
+    assert r1.status_code == 200, r1.json()
+    etag = r1.headers.get("ETag")
+    assert etag
+
+    # matching If-None-Match -> 304 without a body
+    r2 = http.get(f"{api_base}/api/assets/{aid}", headers={"If-None-Match": etag}, timeout=120)
+    assert r2.status_code == 304
+    assert r2.content == b""
+    assert r2.headers.get("ETag") == etag
+
+    # a stale tag still gets the full body
+    r3 = http.get(f"{api_base}/api/assets/{aid}", headers={"If-None-Match": '"stale"'}, timeout=120)
+    assert r3.status_code == 200
+    assert r3.json()["id"] == aid
+
+    # updating the asset changes its representation, and with it the ETag
+    ru = http.put(f"{api_base}/api/assets/{aid}", json={"user_metadata": {"purpose": "etag"}}, timeout=120)
+    assert ru.status_code == 200, ru.json()
+    r4 = http.get(f"{api_base}/api/assets/{aid}", headers={"If-None-Match": etag}, timeout=120)
+    assert r4.status_code == 200
+    assert r4.json()["user_metadata"]["purpose"] == "etag"
+    assert r4.headers.get("ETag") and r4.headers["ETag"] != etag
+
+
 def test_head_asset_by_hash(http: requests.Session, api_base: str, seeded_asset: dict):
     h = seeded_asset["asset_hash"]
 
@@ -117,6 +184,42 @@ def test_head_asset_by_hash(http: requests.Session, api_base: str, seeded_asset:
     assert rh2.status_code == 404
 
 
+def test_head_asset_by_hash_tracks_create_and_delete(
+    http: requests.Session, api_base: str, asset_factory, make_asset_bytes
+):
+    """HEAD answers are cached briefly; uploads, from-hash creates and deletes must not leave them stale."""
+    blake3 = pytest.importorskip("blake3")
+    data = make_asset_bytes(f"head-cache-{uuid.uuid4().hex}", 1536)
+    h = "blake3:" + blake3.blake3(data).hexdigest()
+    tags = ["models", "checkpoints", "unit-tests", "head-cache"]
+
+    def _head() -> int:
+        return http.head(f"{api_base}/api/assets/hash/{h}", timeout=120).status_code
+
+    assert _head() == 404
+    assert _head() == 404  # answered from the cache this time
+
+    first = asset_factory("head_cache_1.safetensors", tags, {}, data)
+    assert first["asset_hash"] == h
+    assert _head() == 200
+
+    r = http.post(
+        f"{api_base}/api/assets/from-hash",
+        json={"hash": h, "name": "head_cache_2.safetensors", "tags": tags},
+        timeout=120,
+    )
+    second = r.json()
+    assert r.status_code == 201, second
+    assert _head() == 200
+
+    # the content is still referenced by the second info
+    assert http.delete(f"{api_base}/api/assets/{first['id']}", timeout=120).status_code == 204
+    assert _head() == 200
+
+    assert http.delete(f"{api_base}/api/assets/{second['id']}", timeout=120).status_code == 204
+    assert _head() == 404
+
+
 def test_head_asset_bad_hash_returns_400_and_no_body(http: requests.Session, api_base: str):
     # Invalid format; handler returns a JSON error, but HEAD responses must not carry a payload.
     # requests exposes an empty body for HEAD, so validate status and that there is no payload.
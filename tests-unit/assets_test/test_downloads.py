@@ -28,6 +28,25 @@ def test_download_attachment_and_inline(http: requests.Session, api_base: str, s
     assert "inline" in cd2
 
 
+def test_download_conditional_get(http: requests.Session, api_base: str, seeded_asset: dict):
+    aid = seeded_asset["id"]
+
+    r1 = http.get(f"{api_base}/api/assets/{aid}/content", timeout=120)
+    assert r1.status_code == 200
+    assert len(r1.content) == 4096
+    etag = r1.headers.get("ETag")
+    assert etag
+    assert r1.headers.get("Last-Modified")
+
+    r2 = http.get(f"{api_base}/api/assets/{aid}/content", headers={"If-None-Match": etag}, timeout=120)
+    assert r2.status_code == 304
+    assert r2.content == b""
+
+    r3 = http.get(f"{api_base}/api/assets/{aid}/content", headers={"If-None-Match": '"stale"'}, timeout=120)
+    assert r3.status_code == 200
+    assert r3.content == r1.content
+
+
 @pytest.mark.skip(reason="Requires computing hashes of files in directories to deduplicate into multiple cache states")
 @pytest.mark.parametrize("root", ["input", "output"])
 def test_download_chooses_existing_state_and_updates_access_time(
@@ -1,8 +1,12 @@
+import json
 import time
 import uuid
 
+import pytest
 import requests
 
+from app.assets.api.schemas_out import AssetsList
+
 
 def test_list_assets_paging_and_sort(http: requests.Session, api_base: str, asset_factory, make_asset_bytes):
     names = ["a1_u.safetensors", "a2_u.safetensors", "a3_u.safetensors"]
@@ -340,3 +344,170 @@ def test_list_assets_name_contains_literal_underscore(
     assert b["name"] not in names, "Underscore must be escaped — should not match 'fooxbar'"
     assert c["name"] not in names, "Underscore must be escaped — should not match 'foobar'"
     assert body["total"] == 1
+
+
+def _walk_by_cursor(http, api_base: str, params: dict) -> list[str]:
+    """Follow next_cursor from the first page until has_more is False; returns the ids seen, in order."""
+    ids: list[str] = []
+    cursor = None
+    for _ in range(50):
+        q = {**params, "cursor": cursor} if cursor else params
+        r = http.get(api_base + "/api/assets", params=q, timeout=120)
+        body = r.json()
+        assert r.status_code == 200, body
+        ids.extend(a["id"] for a in body["assets"])
+        if not body["has_more"]:
+            assert "next_cursor" not in body
+            return ids
+        cursor = body["next_cursor"]
+        assert cursor
+    raise AssertionError("cursor walk did not terminate")
+
+
+@pytest.mark.parametrize("sort", ["name", "created_at", "updated_at", "size", "last_access_time"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_list_assets_cursor_walks_all_pages(http, api_base, asset_factory, make_asset_bytes, sort, order):
+    scope = f"lf-cursor-{uuid.uuid4().hex[:6]}"
+    t = ["models", "checkpoints", "unit-tests", scope]
+    # three rows share a name and four share a size, so pages split inside runs of equal sort values
+    specs = [
+        ("cur_tie.safetensors", 1024),
+        ("cur_tie.safetensors", 1024),
+        ("cur_tie.safetensors", 2048),
+        ("cur_b.safetensors", 1024),
+        ("cur_a.safetensors", 1024),
+    ]
+    for i, (name, size) in enumerate(specs):
+        asset_factory(name, t, {}, make_asset_bytes(f"{scope}-{i}", size))
+
+    base_q = {"include_tags": f"unit-tests,{scope}", "sort": sort, "order": order}
+    r = http.get(api_base + "/api/assets", params={**base_q, "limit": "500"}, timeout=120)
+    full = r.json()
+    assert r.status_code == 200, full
+    expected = [a["id"] for a in full["assets"]]
+    assert len(expected) == len(specs)
+
+    assert _walk_by_cursor(http, api_base, {**base_q, "limit": "2"}) == expected
+    assert _walk_by_cursor(http, api_base, {**base_q, "limit": "1"}) == expected
+
+
+def test_list_assets_cursor_with_filters(http, api_base, asset_factory, make_asset_bytes):
+    scope = f"lf-cursor-flt-{uuid.uuid4().hex[:6]}"
+    keep = ["models", "checkpoints", "unit-tests", scope, "keep"]
+    drop = ["models", "checkpoints", "unit-tests", scope, "drop"]
+    for i in range(4):
+        asset_factory(f"curf_{i}.safetensors", keep, {"group": "g"}, make_asset_bytes(f"{scope}-k{i}", 900))
+    asset_factory("curf_other_group.safetensors", keep, {"group": "h"}, make_asset_bytes(f"{scope}-h", 900))
+    asset_factory("curf_dropped.safetensors", drop, {"group": "g"}, make_asset_bytes(f"{scope}-d", 900))
+    asset_factory("nomatch.safetensors", keep, {"group": "g"}, make_asset_bytes(f"{scope}-n", 900))
+
+    base_q = {
+        "include_tags": f"unit-tests,{scope}",
+        "exclude_tags": "drop",
+        "name_contains": "curf_",
+        "metadata_filter": json.dumps({"group": "g"}),
+        "sort": "name",
+        "order": "asc",
+    }
+    walked = _walk_by_cursor(http, api_base, {**base_q, "limit": "3"})
+    r = http.get(api_base + "/api/assets", params={**base_q, "limit": "500"}, timeout=120)
+    body = r.json()
+    assert r.status_code == 200, body
+    assert [a["name"] for a in body["assets"]] == [f"curf_{i}.safetensors" for i in range(4)]
+    assert walked == [a["id"] for a in body["assets"]]
+
+
+def test_list_assets_include_total_false_omits_total(http, api_base, asset_factory, make_asset_bytes):
+    scope = f"lf-total-{uuid.uuid4().hex[:6]}"
+    t = ["models", "checkpoints", "unit-tests", scope]
+    asset_factory("total_a.safetensors", t, {}, make_asset_bytes(f"{scope}-a", 800))
+    asset_factory("total_b.safetensors", t, {}, make_asset_bytes(f"{scope}-b", 800))
+
+    q = {"include_tags": f"unit-tests,{scope}", "limit": "1"}
+    r1 = http.get(api_base + "/api/assets", params=q, timeout=120)
+    b1 = r1.json()
+    assert r1.status_code == 200, b1
+    assert b1["total"] == 2
+
+    r2 = http.get(api_base + "/api/assets", params={**q, "include_total": "false"}, timeout=120)
+    b2 = r2.json()
+    assert r2.status_code == 200, b2
+    assert "total" not in b2
+    assert len(b2["assets"]) == 1
+    assert b2["has_more"] is True
+
+
+def test_list_assets_cursor_rejected_for_other_sort(http, api_base, asset_factory, make_asset_bytes):
+    scope = f"lf-cursor-bad-{uuid.uuid4().hex[:6]}"
+    t = ["models", "checkpoints", "unit-tests", scope]
+    asset_factory("curbad_a.safetensors", t, {}, make_asset_bytes(f"{scope}-a", 800))
+    asset_factory("curbad_b.safetensors", t, {}, make_asset_bytes(f"{scope}-b", 800))
+
+    q = {"include_tags": f"unit-tests,{scope}", "sort": "name", "limit": "1"}
+    r1 = http.get(api_base + "/api/assets", params=q, timeout=120)
+    b1 = r1.json()
+    assert r1.status_code == 200, b1
+    cursor = b1["next_cursor"]
+
+    r2 = http.get(api_base + "/api/assets", params={**q, "sort": "size", "cursor": cursor}, timeout=120)
+    b2 = r2.json()
+    assert r2.status_code == 400, b2
+    assert b2["error"]["code"] == "INVALID_CURSOR"
+
+    r3 = http.get(api_base + "/api/assets", params={**q, "cursor": "not-a-cursor"}, timeout=120)
+    b3 = r3.json()
+    assert r3.status_code == 400, b3
+    assert b3["error"]["code"] == "INVALID_CURSOR"
+
+
+def test_list_assets_tag_filter_matrix(http, api_base, asset_factory, make_asset_bytes):
+    scope = f"lf-tagmx-{uuid.uuid4().hex[:6]}"
+    base = ["models", "checkpoints", "unit-tests", scope]
+    fixture = {
+        "tmx_a.safetensors": ["t1", "t2"],
+        "tmx_b.safetensors": ["t1"],
+        "tmx_c.safetensors": ["t2", "t3"],
+        "tmx_d.safetensors": [],
+    }
+    for name, extra in fixture.items():
+        asset_factory(name, base + extra, {}, make_asset_bytes(f"{scope}-{name}", 900))
+
+    cases = [
+        ({"include_tags": "t1"}, {"a", "b"}),
+        ({"include_tags": "t1,t2"}, {"a"}),
+        ({"include_tags": "t2,t3"}, {"c"}),
+        ({"include_tags": "t1,t2,t3"}, set()),
+        # repeated include tags count once, whether in one value or across parameters
+        ({"include_tags": "t1,t1"}, {"a", "b"}),
+        ({"include_tags": ["t1", "t1"]}, {"a", "b"}),
+        ({"include_tags": ["t1", "T1 ", "t2"]}, {"a"}),
+        ({"include_tags": "t1", "exclude_tags": "t2"}, {"b"}),
+        ({"exclude_tags": "t1,t3"}, {"d"}),
+        ({"include_tags": "t2", "exclude_tags": "t2"}, set()),
+    ]
+    for params, expected in cases:
+        inc = params.get("include_tags", [])
+        inc = [inc] if isinstance(inc, str) else inc
+        q = {**params, "include_tags": ["unit-tests", scope, *inc], "limit": "50"}
+        r = http.get(api_base + "/api/assets", params=q, timeout=120)
+        body = r.json()
+        assert r.status_code == 200, body
+        got = {a["name"][len("tmx_"):-len(".safetensors")] for a in body["assets"]}
+        assert got == expected, params
+        assert body["total"] == len(expected), params
+
+
+def test_list_assets_response_matches_schema(http, api_base, asset_factory, make_asset_bytes):
+    """list_assets builds its page as plain dicts; schemas_out.AssetsList stays the documented shape."""
+    scope = f"lf-schema-{uuid.uuid4().hex[:6]}"
+    t = ["models", "checkpoints", "unit-tests", scope]
+    asset_factory("schema_a.safetensors", t, {"k": "v"}, make_asset_bytes(f"{scope}-a", 700))
+    asset_factory("schema_b.safetensors", t, {}, make_asset_bytes(f"{scope}-b", 900))
+
+    q = {"include_tags": f"unit-tests,{scope}", "sort": "name", "order": "asc"}
+    for params in ({**q, "limit": "1"}, {**q, "include_total": "false"}, {**q, "include_tags": "no-such-tag"}):
+        r = http.get(api_base + "/api/assets", params=params, timeout=120)
+        body = r.json()
+        assert r.status_code == 200, body
+        # a key the model doesn't know, or a value it would serialize differently, breaks the round trip
+        assert AssetsList.model_validate(body).model_dump(mode="json", exclude_none=True) == body
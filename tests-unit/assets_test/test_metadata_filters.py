@@ -393,3 +393,98 @@ def test_meta_sort_and_paging_under_filter(http, api_base, asset_factory, make_a
     got2 = [a["name"] for a in b2["assets"]]
     assert got2 == [n3]
     assert b2["has_more"] is False
+
+
+def test_meta_update_swaps_bool_and_number_inside_json(http, api_base, asset_factory, make_asset_bytes):
+    # 1 == True in Python; rewriting the metadata must still replace the projected JSON values
+    name = "mf_json_swap.safetensors"
+    tags = ["models", "checkpoints", "unit-tests", "mf-jswap"]
+    created = asset_factory(name, tags, {"j": {"a": 1}, "l": [[1]]}, make_asset_bytes(name, 1024))
+    aid = created["id"]
+
+    def _matches(flt: dict) -> bool:
+        r = http.get(
+            api_base + "/api/assets",
+            params={"include_tags": "unit-tests,mf-jswap", "metadata_filter": json.dumps(flt)},
+            timeout=120,
+        )
+        body = r.json()
+        assert r.status_code == 200, body
+        return any(a["id"] == aid for a in body["assets"])
+
+    ru = http.put(f"{api_base}/api/assets/{aid}", json={"user_metadata": {"j": {"a": True}, "l": [[True]]}}, timeout=120)
+    assert ru.status_code == 200, ru.json()
+    assert _matches({"j": {"a": True}})
+    assert not _matches({"j": {"a": 1}})
+    assert _matches({"l": [[True]]})
+    assert not _matches({"l": [[1]]})
+
+    ru = http.put(f"{api_base}/api/assets/{aid}", json={"user_metadata": {"j": {"a": 1}, "l": [[1]]}}, timeout=120)
+    assert ru.status_code == 200, ru.json()
+    assert _matches({"j": {"a": 1}})
+    assert not _matches({"j": {"a": True}})
+    assert _matches({"l": [[1]]})
+    assert not _matches({"l": [[True]]})
+
+
+def test_meta_number_beyond_int64_range(http, api_base, asset_factory, make_asset_bytes):
+    name = "mf_big_int.safetensors"
+    tags = ["models", "checkpoints", "unit-tests", "mf-bigint"]
+    big = 100000000000000000000
+    asset_factory(name, tags, {"k": big}, make_asset_bytes(name, 1024))
+
+    for value in (big, -big, 1):
+        r = http.get(
+            api_base + "/api/assets",
+            params={"include_tags": "unit-tests,mf-bigint", "metadata_filter": json.dumps({"k": value})},
+            timeout=120,
+        )
+        body = r.json()
+        assert r.status_code == 200, body
+        assert [a["name"] for a in body["assets"]] == ([name] if value == big else [])
+
+
+def test_meta_filter_matrix_on_mixed_fixture(http, api_base, asset_factory, make_asset_bytes):
+    scope = "mf-matrix"
+    tags = ["models", "checkpoints", "unit-tests", scope]
+    fixture = {
+        "mx_a.safetensors": {"k": "x", "n": 1, "b": True, "arr": ["p", "q"]},
+        "mx_b.safetensors": {"k": "y", "n": 2, "b": False, "arr": ["q"]},
+        "mx_c.safetensors": {"k": "x", "n": 2, "nul": None},
+        "mx_d.safetensors": {"n": 1, "b": True},
+        "mx_e.safetensors": {},
+    }
+    for name, meta in fixture.items():
+        asset_factory(name, tags, meta, make_asset_bytes(name, 1500))
+
+    cases = [
+        ({"k": "x"}, {"a", "c"}),
+        # every key must match
+        ({"k": "x", "n": 2}, {"c"}),
+        ({"b": True, "n": 1}, {"a", "d"}),
+        ({"k": "x", "zzz": "v"}, set()),
+        # list alternatives are any-of within a key, still AND across keys
+        ({"k": ["x", "y"], "n": 2}, {"b", "c"}),
+        ({"b": [True, False], "k": "y"}, {"b"}),
+        ({"n": [1, 2], "arr": "p"}, {"a"}),
+        # list-valued metadata matches on any element
+        ({"arr": "q"}, {"a", "b"}),
+        ({"arr": ["p"], "k": "x"}, {"a"}),
+        # None matches a missing key or an all-null value, alone or among alternatives
+        ({"k": None}, {"d", "e"}),
+        ({"nul": None}, {"a", "b", "c", "d", "e"}),
+        ({"k": [None, "y"]}, {"b", "d", "e"}),
+        ({"k": [None, "y"], "n": 1}, {"d"}),
+        ({"k": "x", "zzz": None}, {"a", "c"}),
+    ]
+    for flt, expected in cases:
+        r = http.get(
+            api_base + "/api/assets",
+            params={"include_tags": f"unit-tests,{scope}", "metadata_filter": json.dumps(flt), "limit": "50"},
+            timeout=120,
+        )
+        body = r.json()
+        assert r.status_code == 200, body
+        got = {a["name"][len("mx_"):-len(".safetensors")] for a in body["assets"]}
+        assert got == expected, flt
+        assert body["total"] == len(expected), flt
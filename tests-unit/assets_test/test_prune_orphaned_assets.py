@@ -139,3 +139,38 @@ def test_special_chars_in_path_escaped_correctly(
     trigger_sync_seed_assets(http, api_base)
 
     assert find_asset(scope.split("/")[0], fp.name), "Asset with special chars should survive"
+
+
+def test_pruned_seed_asset_leaves_no_dependent_rows(
+    create_seed_file,
+    find_asset,
+    http: requests.Session,
+    api_base: str,
+    db_query,
+):
+    """Pruning an orphaned seed removes its tag, meta and cache-state rows along with it."""
+    scope = f"prune-fk-{uuid.uuid4().hex[:6]}"
+    fp = create_seed_file("input", scope)
+
+    trigger_sync_seed_assets(http, api_base)
+    [found] = find_asset(scope, fp.name)
+    info_id = found["id"]
+    [(asset_id,)] = db_query("SELECT asset_id FROM assets_info WHERE id = ?", info_id)
+
+    def _count(table: str, column: str, value: str) -> int:
+        return db_query(f"SELECT COUNT(*) FROM {table} WHERE {column} = ?", value)[0][0]
+
+    assert _count("asset_info_tags", "asset_info_id", info_id) > 0
+    assert _count("asset_info_meta", "asset_info_id", info_id) > 0
+    assert _count("asset_cache_state", "asset_id", asset_id) == 1
+
+    fp.unlink()
+    r = http.post(f"{api_base}/api/assets/seed", json={"roots": ["models", "input", "output"]}, timeout=120)
+    assert r.status_code == 200, r.json()
+
+    assert not find_asset(scope, fp.name)
+    assert _count("assets", "id", asset_id) == 0
+    assert _count("assets_info", "id", info_id) == 0
+    assert _count("asset_info_tags", "asset_info_id", info_id) == 0
+    assert _count("asset_info_meta", "asset_info_id", info_id) == 0
+    assert _count("asset_cache_state", "asset_id", asset_id) == 0
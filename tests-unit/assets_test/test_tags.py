@@ -3,6 +3,8 @@ import uuid
 
 import requests
 
+from app.assets.api.schemas_out import TagsList
+
 
 def test_tags_present(http: requests.Session, api_base: str, seeded_asset: dict):
     # Include zero-usage tags by default
@@ -223,3 +225,12 @@ def test_tags_prefix_treats_underscore_literal(
     assert tag_ok in names, f"Expected {tag_ok} to be returned for prefix '{base}_'"
     assert tag_bad not in names, f"'{tag_bad}' must not match — '_' is not a wildcard"
     assert body["total"] == 1
+
+
+def test_tags_response_matches_schema(http: requests.Session, api_base: str, seeded_asset: dict):
+    """list_tags builds its page as plain dicts; schemas_out.TagsList stays the documented shape."""
+    for params in ({"limit": "5"}, {"include_zero": "false", "prefix": "unit"}, {"prefix": "no-such-tag"}):
+        r = http.get(api_base + "/api/tags", params=params, timeout=120)
+        body = r.json()
+        assert r.status_code == 200, body
+        assert TagsList.model_validate(body).model_dump(mode="json") == body